@@ -0,0 +1,111 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# 워커별 상태: initializer 에서 한 번만 만든다
+_shared = {}
+_figure = None
+_cache = None
+
+
+def _init_worker(shared, cache_dir=None):
+    global _shared, _figure, _cache
+    import matplotlib.pyplot as plt
+    from gg import RenderCache
+
+    plt.switch_backend('Agg')
+    _shared = shared or {}
+    _figure = plt.figure()
+    _cache = RenderCache(cache_dir) if cache_dir else None
+
+
+def _slice_data(spec):
+    data = spec.get('data')
+    if isinstance(data, str):
+        data = _shared[data]
+    where = spec.get('where')
+    if where:
+        mask = None
+        for col, value in where.items():
+            cond = data[col].isin(value) if isinstance(value, (list, tuple, set)) else data[col] == value
+            mask = cond if mask is None else mask & cond
+        data = data[mask]
+    if spec.get('query'):
+        data = data.query(spec['query'])
+    return data
+
+
+def _render_one(spec):
+    from gg import Gg
+
+    started = time.perf_counter()
+    result = {'path': spec.get('path'), 'ok': False, 'seconds': None, 'error': None, 'cached': False}
+    try:
+        # 공유 figure 는 close() 해도 닫히지 않고, pairplot 처럼 새로 만든 figure 만 닫힌다
+        with Gg(_slice_data(spec)) as g:
+            g.figure = _figure
+            if _cache is not None:
+                g.cache(_cache)
+                hits = _cache.hits
+            if spec.get('mapping'):
+                g.aes(**spec['mapping'])
+            g.set_geom(spec['geom'])
+            if spec.get('theme'):
+                g.set_theme_from_yaml(spec['theme'])
+            if spec.get('title'):
+                g.title = spec['title']
+            g.draw().save(spec['path'])
+        result['ok'] = True
+        result['cached'] = _cache is not None and _cache.hits > hits
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    result['seconds'] = time.perf_counter() - started
+    return result
+
+
+def render_batch(specs, shared=None, processes=None, chunksize=4, cache_dir=None):
+    """
+    Render many charts in a process pool (Agg backend, one reused figure per worker).
+
+    Each spec is a dict:
+        data     : DataFrame, or a key of `shared` (sent to each worker once, not per chart)
+        where    : optional {column: value or list} slice of data
+        query    : optional DataFrame.query string applied after `where`
+        mapping  : aes() keyword arguments
+        geom     : geom name, e.g. 'line'
+        theme    : optional theme name in gg_theme.yml
+        title    : optional chart title
+        path     : output file
+    With `cache_dir`, charts whose fingerprint is already in that RenderCache are copied, not drawn.
+    Returns one {'path', 'ok', 'seconds', 'error', 'cached'} dict per spec, in order.
+    """
+    processes = processes or os.cpu_count() or 1
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(shared, cache_dir)) as pool:
+        results = list(pool.map(_render_one, specs, chunksize=chunksize))
+    failed = [r for r in results if not r['ok']]
+    cached = sum(1 for r in results if r['cached'])
+    print(
+        f"✅ {len(results) - len(failed)} rendered ({cached} from cache), ❌ {len(failed)} failed "
+        f"({time.perf_counter() - started:.1f}s, {processes} processes)"
+    )
+    for r in failed:
+        print(f"  ❌ {r['path']}: {r['error']}")
+    return results
+
+
+if __name__ == "__main__":
+    import numpy as np
+    import pandas as pd
+
+    df = pd.DataFrame({
+        'country': np.repeat(['A', 'B', 'C', 'D'], 50),
+        'year': np.tile(np.arange(1974, 2024), 4),
+        'value': np.random.randn(200).cumsum(),
+    })
+    specs = [
+        {'data': 'wpp', 'where': {'country': c}, 'mapping': {'x': 'year', 'y': 'value'},
+         'geom': 'line', 'theme': 'modern', 'title': c, 'path': f"chart_{c}.png"}
+        for c in df['country'].unique()
+    ]
+    render_batch(specs, shared={'wpp': df})
@@ -0,0 +1,472 @@
+"""
+Rendering benchmarks for gg: every geom that has a draw function, on every engine, over
+synthetic data from 1e3 to 1e7 rows.
+
+    python bench.py [run] [--out bench.json] [--sizes 1e3,1e5] [--geoms line,bar]
+                    [--engines matplotlib] [--themes default,modern] [--repeat 3] [--no-memory]
+    python bench.py compare old.json new.json [--threshold 0.1]
+
+Each case runs with the empty default theme and with named gg_theme.yml themes. Per case it
+records `_data_process`, theme application, draw and PNG/SVG save times (ms, best of `repeat`;
+for matplotlib engines draw excludes the theme), output sizes and the tracemalloc peak of one
+extra draw+save pass. Geoms whose output only makes sense at small sizes (one bar/wedge/node
+per row, annotated heatmaps, ...) have a `max_rows`; larger sizes are listed as skipped.
+"""
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+DEFAULT_THEMES = ('default', 'modern')  # 'default' = 테마 미지정 (빈 theme)
+METRICS = ('data_process_ms', 'theme_ms', 'draw_ms', 'save_png_ms', 'save_svg_ms', 'peak_mb')
+NOISE_FLOOR = {'peak_mb': 1.0}  # 이보다 작은 차이는 회귀로 보지 않는다 (나머지는 1 ms)
+
+
+# ───────────────────────────────────────────────
+# geom 별 합성 데이터: (n, rng) -> (data dict, mapping)
+# ───────────────────────────────────────────────
+
+def _labels(n, prefix='c'):
+    return np.char.add(prefix, np.arange(n).astype(str))
+
+
+def _series(n, rng):
+    return {'x': np.arange(n), 'y': rng.standard_normal(n).cumsum()}, {'x': 'x', 'y': 'y'}
+
+
+def _cloud(n, rng):
+    return {'x': rng.standard_normal(n), 'y': rng.standard_normal(n)}, {'x': 'x', 'y': 'y'}
+
+
+def _bars(n, rng):
+    return {'x': np.arange(n), 'y': rng.random(n)}, {'x': 'x', 'y': 'y'}
+
+
+def _stacked(n, rng):
+    data = {'x': np.arange(n), 'y1': rng.random(n), 'y2': rng.random(n)}
+    return data, {'x': 'x', 'y1': 'y1', 'y2': 'y2'}
+
+
+def _values(n, rng):
+    return {'x': rng.standard_normal(n)}, {'x': 'x'}
+
+
+def _groups(n, rng):
+    data = {f"y{i}": rng.standard_normal(n) + i for i in range(1, 4)}
+    return data, {k: k for k in data}
+
+
+def _pie(n, rng):
+    return {'x': _labels(n), 'y': rng.random(n) + 0.1}, {'x': 'x', 'y': 'y'}
+
+
+def _heat(n, rng):
+    # 10x10 격자에 n 행: 중복 (x, y) 는 pivot_table 평균으로 합쳐진다
+    data = {'x': rng.integers(0, 10, n), 'y': rng.integers(0, 10, n), 'value': rng.random(n)}
+    return data, {'x': 'x', 'y': 'y', 'value': 'value'}
+
+
+def _stream(n, rng):
+    return {c: rng.standard_normal(n).cumsum() for c in 'abc'}, {}
+
+
+def _confuse(n, rng):
+    return {f"p{i}": rng.integers(0, 100, 10) for i in range(10)}, {}
+
+
+def _decomposition(n, rng):
+    t = np.arange(n)
+    data = {
+        'trend': t * 0.01,
+        'seasonal': np.sin(t * 2 * np.pi / 365),
+        'residual': rng.standard_normal(n) * 0.1,
+    }
+    return data, {}
+
+
+def _decision(n, rng):
+    data = {'condition': np.char.add('x > ', np.arange(n).astype(str)), 'result': rng.choice(['yes', 'no'], n)}
+    return data, {'condition': 'condition', 'result': 'result'}
+
+
+def _event(n, rng):
+    return {'time': np.arange(n), 'event': _labels(n, 'e')}, {'x': 'time', 'y': 'event'}
+
+
+def _pair(n, rng):
+    return {c: rng.standard_normal(n) for c in 'abc'}, {}
+
+
+def _polar(n, rng):
+    return {'x': _labels(n), 'y': rng.random(n)}, {'x': 'x', 'y': 'y'}
+
+
+def _hierarchy(n, rng):
+    return {'x': _labels(50)[rng.integers(0, 50, n)], 'y': rng.random(n)}, {'x': 'x', 'y': 'y'}
+
+
+def _sankey(n, rng):
+    data = {
+        'nodes': _labels(n, 'n'),
+        'source': rng.integers(0, n, n),
+        'target': rng.integers(0, n, n),
+        'value': rng.random(n),
+    }
+    return data, {}
+
+
+def _parallel(n, rng):
+    data = {c: rng.standard_normal(n) for c in 'abc'}
+    data['color'] = rng.random(n)
+    return data, {'color': 'color'}
+
+
+def _surface(n, rng):
+    side = max(int(np.sqrt(n)), 2)
+    x, y = np.meshgrid(np.arange(side), np.arange(side))
+    return {'x': x.ravel(), 'y': y.ravel(), 'value': np.sin(x.ravel() / 10) * np.cos(y.ravel() / 10)}, {}
+
+
+def _network(n, rng):
+    return {'nodes': np.arange(n), 'edges': list(zip(range(n), rng.integers(0, n, n).tolist()))}, {}
+
+
+# geom -> (generator, max_rows)
+SYNTHETIC = {
+    'bar': (_bars, 10_000),
+    'point': (_cloud, None),
+    'stacked': (_stacked, 10_000),
+    'histogram': (_values, None),
+    'line': (_series, None),
+    'scatter': (_cloud, None),
+    'box': (_groups, 1_000_000),
+    'pie': (_pie, 1_000),
+    'heat': (_heat, None),
+    'area': (_series, None),
+    'stream': (_stream, 1_000_000),
+    'confuse': (_confuse, 1_000),
+    'decomposition': (_decomposition, 1_000_000),
+    'decision': (_decision, 10_000),
+    'violin': (_groups, 100_000),
+    'pair': (_pair, 10_000),
+    'density': (_values, 100_000),
+    'spider': (_polar, 10_000),
+    'treemap': (_hierarchy, 100_000),
+    'sankey': (_sankey, 1_000),
+    'icicle': (_hierarchy, 100_000),
+    'parallel': (_parallel, 100_000),
+    'surface': (_surface, 1_000_000),
+    'network': (_network, 1_000),
+    'event': (_event, 10_000),
+}
+
+
+# ───────────────────────────────────────────────
+# 측정
+# ───────────────────────────────────────────────
+
+def _timed(func, *args):
+    started = time.perf_counter()
+    func(*args)
+    return (time.perf_counter() - started) * 1e3
+
+
+def bench_startup(engines, repeat=3):
+    """
+    Cold `import gg` and first use of each engine, each in a fresh interpreter (best of `repeat`).
+    """
+    result = {'import_ms': None, 'engine_import_ms': {}}
+    env = dict(os.environ, MPLBACKEND='Agg')
+    for engine in engines:
+        code = (
+            "import time; t0 = time.perf_counter(); import gg; t1 = time.perf_counter(); "
+            f"gg.GEOMS.renderer({engine!r}).load(); "
+            "print((t1 - t0) * 1e3, (time.perf_counter() - t1) * 1e3)"
+        )
+        best = None
+        for _ in range(repeat):
+            out = subprocess.run([sys.executable, '-c', code], cwd=HERE, env=env, capture_output=True, text=True)
+            if out.returncode != 0:
+                best = out.stderr.strip().splitlines()[-1]
+                break
+            times = [float(v) for v in out.stdout.split()]
+            best = times if best is None else [min(a, b) for a, b in zip(best, times)]
+        if isinstance(best, str):
+            result['engine_import_ms'][engine] = {'error': best}
+            continue
+        result['import_ms'] = best[0] if result['import_ms'] is None else min(result['import_ms'], best[0])
+        result['engine_import_ms'][engine] = best[1]
+
+    import gg
+    gg._theme_cache.clear()
+    result['theme_load_ms'] = _timed(gg.load_themes)
+    themes = gg.load_themes()
+    result['theme_compile_ms'] = _timed(lambda: [gg.CompiledTheme(t.source) for t in themes.values()])
+    return result
+
+
+def _new_gg(data, mapping, geom, engine, theme='default'):
+    from gg import Gg
+    g = Gg()
+    if theme != 'default':
+        g.set_theme_from_yaml(theme)
+    elapsed = _timed(g._data_process, data)
+    g.aes(**mapping)
+    # combi.yml 과 무관하게 이 engine 의 draw 함수로 그린다
+    g.geom, g.geom_engine = geom, engine
+    return g, elapsed
+
+
+def _draw_timed(g, renderer, timings):
+    """
+    g.draw(), recording theme application and the rest of the draw as separate times.
+    """
+    import gg
+    if type(renderer).draw is not gg.MatplotlibRenderer.draw:
+        timings['draw_ms'] = _timed(g.draw)
+        return
+    # MatplotlibRenderer.draw 를 단계별로 풀어서 잰다 (theme 시간이 draw 에 섞이지 않게)
+    func = renderer.geom_func(g)
+    started = time.perf_counter()
+    g._load_source()
+    renderer.load()
+    with gg.mpl.rc_context(g._get_compiled_theme().rc):
+        timings['theme_ms'] = _timed(g._apply_theme_matplotlib)
+        g._apply_text_matplotlib()
+        func(g)
+    timings['draw_ms'] = (time.perf_counter() - started) * 1e3 - timings['theme_ms']
+
+
+def _run_once(data, mapping, geom, engine, out_dir, theme='default'):
+    import gg
+    renderer = gg.GEOMS.renderer(engine)
+    timings, errors, sizes = {}, {}, {}
+    g, timings['data_process_ms'] = _new_gg(data, mapping, geom, engine, theme)
+    try:
+        renderer.load()
+    except ImportError as e:
+        errors['load'] = f"{type(e).__name__}: {e}"
+        return timings, errors, sizes
+    try:
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                _draw_timed(g, renderer, timings)
+        except Exception as e:
+            errors['draw'] = f"{type(e).__name__}: {e}"
+            return timings, errors, sizes
+        if renderer.cacheable:
+            for ext in ('png', 'svg'):
+                path = os.path.join(out_dir, f"{engine}_{geom}.{ext}")
+                try:
+                    timings[f"save_{ext}_ms"] = _timed(g.save, path)
+                    sizes[f"{ext}_bytes"] = os.path.getsize(path) if os.path.exists(path) else None
+                except Exception as e:
+                    errors[f"save_{ext}"] = f"{type(e).__name__}: {e}"
+    finally:
+        g.close()
+    return timings, errors, sizes
+
+
+def _peak_memory(data, mapping, geom, engine, out_dir, theme='default'):
+    import gg
+    tracemalloc.start()
+    try:
+        g, _ = _new_gg(data, mapping, geom, engine, theme)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                g.draw()
+            if gg.GEOMS.renderer(engine).cacheable:
+                g.save(os.path.join(out_dir, f"{engine}_{geom}_mem.png"))
+        finally:
+            g.close()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def bench_case(geom, engine, rows, repeat=3, memory=True, out_dir=None, seed=0, theme='default'):
+    generator, max_rows = SYNTHETIC[geom]
+    case_id = f"{engine}/{geom}/{rows}" if theme == 'default' else f"{engine}/{geom}/{rows}/{theme}"
+    case = {'id': case_id, 'geom': geom, 'engine': engine, 'rows': rows, 'theme': theme}
+    if max_rows is not None and rows > max_rows:
+        case['skipped'] = f"rows > max_rows ({max_rows})"
+        return case
+    data, mapping = generator(rows, np.random.default_rng(seed))
+    case['data_rows'] = len(next(iter(data.values())))
+    best, errors = {}, {}
+    for _ in range(repeat):
+        timings, errors, sizes = _run_once(data, mapping, geom, engine, out_dir, theme)
+        for key, value in timings.items():
+            best[key] = value if key not in best else min(best[key], value)
+        if errors:
+            break
+    case.update({key: best.get(key) for key in METRICS if key != 'peak_mb'})
+    case.update(sizes)
+    if errors:
+        case['errors'] = errors
+    elif memory:
+        case['peak_mb'] = _peak_memory(data, mapping, geom, engine, out_dir, theme)
+    return case
+
+
+def implemented_geoms(engines=None, geoms=None):
+    """
+    (geom, engine) pairs that have a draw function, plus combi.yml geoms that have none.
+    """
+    import gg
+    gg.GEOMS._ensure_loaded()
+    pairs = [
+        (geom, engine)
+        for engine, renderer in gg.GEOMS.renderers.items()
+        if engines is None or engine in engines
+        for geom in renderer.geoms
+        if geoms is None or geom in geoms
+    ]
+    drawn = {(geom, engine) for engine, r in gg.GEOMS.renderers.items() for geom in r.geoms}
+    missing = sorted(f"{e}/{g}" for g, e in gg.GEOMS.engine_of.items() if (g, e) not in drawn)
+    return pairs, missing
+
+
+def _versions():
+    versions = {'python': platform.python_version()}
+    for module in ('numpy', 'pandas', 'matplotlib', 'seaborn', 'plotly', 'networkx'):
+        try:
+            versions[module] = __import__(module).__version__
+        except ImportError:
+            versions[module] = None
+    return versions
+
+
+def _git_commit():
+    out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=HERE, capture_output=True, text=True)
+    return out.stdout.strip() or None
+
+
+def run(sizes=DEFAULT_SIZES, engines=None, geoms=None, repeat=3, memory=True, themes=DEFAULT_THEMES):
+    pairs, missing = implemented_geoms(engines, geoms)
+    used_engines = sorted({engine for _, engine in pairs})
+    report = {
+        'meta': {
+            'started': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'platform': platform.platform(),
+            'versions': _versions(),
+            'commit': _git_commit(),
+            'sizes': list(sizes),
+            'themes': list(themes),
+            'repeat': repeat,
+            'not_implemented': missing,
+        },
+        'startup': bench_startup(used_engines),
+        'cases': [],
+    }
+    with tempfile.TemporaryDirectory() as out_dir:
+        for geom, engine in pairs:
+            for theme in themes:
+                for rows in sizes:
+                    case = bench_case(geom, engine, rows, repeat, memory, out_dir, theme=theme)
+                    report['cases'].append(case)
+                    if 'skipped' in case:
+                        continue
+                    if 'errors' in case:
+                        print(f"❌ {case['id']}: {'; '.join(case['errors'].values())}")
+                    else:
+                        print(f"✅ {case['id']}: theme {_fmt(case.get('theme_ms'))} ms, "
+                              f"draw {_fmt(case.get('draw_ms'))} ms, png {_fmt(case.get('save_png_ms'))} ms, "
+                              f"peak {_fmt(case.get('peak_mb'))} MB")
+    return report
+
+
+# ───────────────────────────────────────────────
+# 두 결과 비교
+# ───────────────────────────────────────────────
+
+def _fmt(value):
+    return '-' if value is None else f"{value:.1f}"
+
+
+def compare(old, new, threshold=0.1):
+    """
+    Return rows (case id, metric, old, new, ratio, regressed) for cases present in both reports.
+    """
+    old_cases = {c['id']: c for c in old['cases']}
+    rows = []
+    for case in new['cases']:
+        before = old_cases.get(case['id'])
+        if before is None:
+            continue
+        for metric in METRICS:
+            a, b = before.get(metric), case.get(metric)
+            if a is None or b is None:
+                continue
+            ratio = b / a if a else float('inf')
+            regressed = ratio > 1 + threshold and b - a > NOISE_FLOOR.get(metric, 1.0)
+            rows.append((case['id'], metric, a, b, ratio, regressed))
+    return rows
+
+
+def print_comparison(old, new, threshold=0.1):
+    rows = compare(old, new, threshold)
+    for key in ('import_ms', 'theme_load_ms', 'theme_compile_ms'):
+        a, b = old['startup'].get(key), new['startup'].get(key)
+        if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+            print(f"   startup {key:<18} {_fmt(a):>10} -> {_fmt(b):>10}")
+    for case_id, metric, a, b, ratio, regressed in rows:
+        mark = '❌' if regressed else ('✅' if ratio < 1 - threshold else '  ')
+        print(f"{mark} {case_id:<40} {metric:<16} {_fmt(a):>10} -> {_fmt(b):>10}  x{ratio:.2f}")
+    old_ids, new_ids = {c['id'] for c in old['cases']}, {c['id'] for c in new['cases']}
+    for case_id in sorted(old_ids ^ new_ids):
+        print(f"   {case_id}: only in {'old' if case_id in old_ids else 'new'}")
+    regressions = [r for r in rows if r[5]]
+    print(f"{'❌' if regressions else '✅'} {len(regressions)} regressions over {threshold:.0%} "
+          f"({len(rows)} metrics compared)")
+    return regressions
+
+
+def _option(args, name, default=None):
+    if name in args:
+        return args[args.index(name) + 1]
+    return default
+
+
+def main():
+    args = sys.argv[1:]
+    if args and args[0] == 'compare':
+        with open(args[1], encoding='utf-8') as f:
+            old = json.load(f)
+        with open(args[2], encoding='utf-8') as f:
+            new = json.load(f)
+        regressions = print_comparison(old, new, float(_option(args, '--threshold', 0.1)))
+        sys.exit(1 if regressions else 0)
+
+    sizes = _option(args, '--sizes')
+    engines = _option(args, '--engines')
+    geoms = _option(args, '--geoms')
+    themes = _option(args, '--themes')
+    out = _option(args, '--out', 'bench.json')
+    report = run(
+        sizes=[int(float(s)) for s in sizes.split(',')] if sizes else DEFAULT_SIZES,
+        engines=engines.split(',') if engines else None,
+        geoms=geoms.split(',') if geoms else None,
+        repeat=int(_option(args, '--repeat', 3)),
+        memory='--no-memory' not in args,
+        themes=themes.split(',') if themes else DEFAULT_THEMES,
+    )
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, default=str)
+    print(f"📄 {out}: {len(report['cases'])} cases")
+
+
+if __name__ == "__main__":
+    main()
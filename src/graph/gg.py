@@ -1,52 +1,550 @@
-import pandas as pd
-import numpy as np
-import seaborn as sns
-import yaml
-import matplotlib.pyplot as plt
-import matplotlib as mpl
-
-#dd
+import copy
+import hashlib
+import importlib
+import json
+import os
+import shutil
+import tempfile
+import time
+import weakref
+
+
+class _LazyModule():
+    """
+    Module proxy that imports `name` on first attribute access, so `import gg` stays cheap
+    and each engine's library is only loaded when a geom of that engine is drawn.
+    """
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+pd = _LazyModule('pandas')
+np = _LazyModule('numpy')
+sns = _LazyModule('seaborn')
+yaml = _LazyModule('yaml')
+jsonschema = _LazyModule('jsonschema')
+plt = _LazyModule('matplotlib.pyplot')
+mpl = _LazyModule('matplotlib')
+
+THEME_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gg_theme.yml')
+THEME_SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'schema_gg_theme.json')
+COMBI_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'combi.yml')
+GEOM_ENTRY_POINT_GROUP = 'graph.geoms'
+# draw 함수의 출력이 바뀌면 올린다 → 이전에 캐시된 렌더 결과를 쓰지 않게 된다
+RENDER_VERSION = 1
+
+# yaml 경로 -> (mtime, {테마 이름: CompiledTheme}); 파일이 바뀌면 다시 읽는다
+_theme_cache = {}
+_theme_schema = None
+
+class Renderer():
+    """
+    Draws the geoms of one engine. `modules` are imported the first time the engine is used;
+    `geoms` maps geom name -> draw function taking the Gg object, `updaters` maps geom name ->
+    function that swaps new data into the already drawn artists (returns False if it can't).
+    """
+    modules = ()
+    cacheable = True  # 출력이 파일이면 RenderCache 로 다시 그리기를 건너뛸 수 있다
+
+    def __init__(self, name):
+        self.name = name
+        self.geoms = {}
+        self.updaters = {}
+        self._loaded = False
+
+    def versions(self):
+        """
+        {package: version} of the libraries this engine renders with (part of the render fingerprint).
+        """
+        if not hasattr(self, '_versions'):
+            from importlib.metadata import PackageNotFoundError, version
+            self._versions = {}
+            for package in sorted({module.split('.')[0] for module in self.modules}):
+                try:
+                    self._versions[package] = version(package)
+                except PackageNotFoundError:
+                    self._versions[package] = None
+        return self._versions
+
+    def load(self):
+        if not self._loaded:
+            for module in self.modules:
+                importlib.import_module(module)
+            self._loaded = True
+        return self
+
+    def geom_func(self, g):
+        func = self.geoms.get(g.geom)
+        if func is None:
+            raise NotImplementedError(f"{self.name} drawing not implemented for geom {g.geom}")
+        return func
+
+    def draw(self, g):
+        func = self.geom_func(g)
+        self.load()
+        func(g)
+
+    def update(self, g):
+        self.draw(g)
+
+    def show(self, g):
+        pass
+
+    def save(self, g, path):
+        pass
+
+
+class MatplotlibRenderer(Renderer):
+    modules = ('matplotlib.pyplot',)
+
+    def draw(self, g):
+        func = self.geom_func(g)
+        self.load()
+        with mpl.rc_context(g._get_compiled_theme().rc):
+            g._apply_theme_matplotlib()
+            g._apply_text_matplotlib()
+            func(g)
+
+    def update(self, g):
+        func = self.updaters.get(g.geom)
+        if g.ax is None or func is None:
+            return self.draw(g)
+        with mpl.rc_context(g._get_compiled_theme().rc):
+            if func(g) is False:
+                return self.draw(g)
+            g.ax.autoscale_view()
+        # artist 가 stale 로 표시되므로 대화형 모드/plt.pause() 가 알아서 다시 그리고,
+        # Agg 에서는 save 시점에 한 번만 그린다
+
+    def show(self, g):
+        plt.show()
+
+    def save(self, g, path):
+        with mpl.rc_context(g._get_compiled_theme().rc):
+            g.figure.savefig(path, bbox_inches='tight')
+
+
+class SeabornRenderer(MatplotlibRenderer):
+    modules = ('matplotlib.pyplot', 'seaborn')
+
+
+class NetworkxRenderer(MatplotlibRenderer):
+    modules = ('matplotlib.pyplot', 'networkx')
+
+    def draw(self, g):
+        g._ensure_figure()
+        Renderer.draw(self, g)
+
+
+class PlotlyRenderer(Renderer):
+    modules = ('plotly.express', 'plotly.graph_objects')
+
+    def show(self, g):
+        if g.last_fig is not None:
+            g.last_fig.show()
+
+    def save(self, g, path):
+        if g.last_fig is not None:
+            g.last_fig.write_image(path)
+
+
+class ConsoleRenderer(Renderer):
+    cacheable = False
+
+
+class GeomRegistry():
+    """
+    geom -> engine (from combi.yml, then entry points) and engine -> Renderer.
+
+    Plugins register under the `graph.geoms` entry-point group; each entry point loads a
+    callable that receives this registry (e.g. to add_renderer / register / set_engine).
+    """
+    def __init__(self, combi_path=COMBI_PATH):
+        self.combi_path = combi_path
+        self.renderers = {}
+        self.engine_of = {}
+        self._loaded = False
+
+    def add_renderer(self, renderer):
+        self.renderers[renderer.name] = renderer
+        return renderer
+
+    def set_engine(self, geom, engine):
+        self.engine_of[geom] = engine
+
+    def register(self, geom, engine):
+        """
+        Decorator registering a draw function for `geom` on the `engine` renderer.
+        """
+        def decorator(func):
+            self.renderers[engine].geoms[geom] = func
+            return func
+        return decorator
+
+    def register_update(self, geom, engine):
+        """
+        Decorator registering an in-place data update for `geom` on the `engine` renderer.
+        """
+        def decorator(func):
+            self.renderers[engine].updaters[geom] = func
+            return func
+        return decorator
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        with open(self.combi_path, 'r', encoding='utf-8') as f:
+            combi = yaml.safe_load(f)
+        for engine, geoms in combi.items():
+            for geom in geoms:
+                self.engine_of[geom] = engine
+        from importlib.metadata import entry_points
+        for ep in entry_points(group=GEOM_ENTRY_POINT_GROUP):
+            ep.load()(self)
+
+    def engine(self, geom):
+        self._ensure_loaded()
+        return self.engine_of.get(geom, 'unknown')
+
+    def renderer(self, engine):
+        renderer = self.renderers.get(engine)
+        if renderer is None:
+            raise ValueError(f"Unknown geom engine: {engine}")
+        return renderer
+
+
+GEOMS = GeomRegistry()
+GEOMS.add_renderer(MatplotlibRenderer('matplotlib'))
+GEOMS.add_renderer(SeabornRenderer('seaborn'))
+GEOMS.add_renderer(NetworkxRenderer('networkx'))
+GEOMS.add_renderer(PlotlyRenderer('plotly'))
+GEOMS.add_renderer(ConsoleRenderer('console'))
+
+
+class RenderCache():
+    """
+    Content-addressed store of rendered files: `<fingerprint><ext>` in `directory`.
+
+    Hits refresh the file mtime, which is the LRU clock; when the directory grows past
+    `max_bytes` the least recently used files are deleted down to 90 %. Several processes
+    may share one directory: files are written under unique temp names and renamed into
+    place, and a file evicted by another process is simply a miss. The directory size is
+    tracked incrementally and rescanned every `rescan_every` stores (to see other processes'
+    files) instead of after every store.
+    """
+    def __init__(self, directory, max_bytes=512 * 1024 * 1024, rescan_every=100):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.rescan_every = rescan_every
+        self.hits = 0
+        self.misses = 0
+        self._bytes = None  # 디렉터리 크기 추정치 (None = 아직 안 셈)
+        self._stores = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key, ext):
+        return os.path.join(self.directory, key + ext)
+
+    def fetch(self, key, ext, dest):
+        """
+        Link (or copy) the cached artifact to `dest`; False on a miss.
+        """
+        src = self._path(key, ext)
+        try:
+            if os.path.abspath(src) != os.path.abspath(dest):
+                if os.path.lexists(dest):
+                    os.remove(dest)
+                try:
+                    os.link(src, dest)
+                except FileNotFoundError:
+                    raise
+                except OSError:
+                    shutil.copyfile(src, dest)
+            elif not os.path.exists(src):
+                raise FileNotFoundError(src)
+        except FileNotFoundError:
+            self.misses += 1
+            return False
+        try:
+            os.utime(src)
+        except FileNotFoundError:
+            pass  # 링크한 뒤 다른 프로세스가 지움: dest 는 이미 완성됨
+        self.hits += 1
+        return True
+
+    def store(self, key, ext, src):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        os.close(fd)
+        try:
+            shutil.copyfile(src, tmp)
+            size = os.path.getsize(tmp)
+            os.replace(tmp, self._path(key, ext))
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        self._stores += 1
+        if self._bytes is None or self._stores % self.rescan_every == 0:
+            self.evict()
+        else:
+            self._bytes += size
+            if self._bytes > self.max_bytes:
+                self.evict()
+
+    def evict(self):
+        entries = []
+        now = time.time()
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue  # 다른 프로세스가 이미 지움
+            if name.endswith('.tmp'):
+                if now - st.st_mtime > 3600:  # 중단된 store 의 잔여물
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        if total > self.max_bytes:
+            target = self.max_bytes * 0.9
+            for _, size, path in sorted(entries):
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+        self._bytes = total
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
+
+
+# 매핑된 열 외의 데이터(전체 열, index)를 직접 그리는 geom → 지문에 DataFrame 전체를 넣는다
+WHOLE_FRAME_GEOMS = {
+    'heat', 'stream', 'confuse', 'decomposition', 'pair', 'sankey', 'surface', 'network', 'parallel',
+}
+
+
+# pyarrow 스타일 (column, op, value) 필터 → SQL 연산자
+SQL_FILTER_OPS = {'=': '=', '==': '=', '!=': '<>', '<': '<', '<=': '<=', '>': '>', '>=': '>=', 'in': 'IN', 'not in': 'NOT IN'}
+
+
+def _quote_identifier(name):
+    """
+    MySQL identifier quoting, part by part: schema.table -> `schema`.`table`.
+    """
+    return '.'.join(f"`{part.replace('`', '``')}`" for part in name.split('.'))
+
+
+def _filter_frame(df, filters):
+    mask = np.ones(len(df), dtype=bool)
+    for col, op, value in filters:
+        s = df[col]
+        if op in ('=', '=='):
+            mask &= (s == value).to_numpy()
+        elif op == '!=':
+            mask &= (s != value).to_numpy()
+        elif op == '<':
+            mask &= (s < value).to_numpy()
+        elif op == '<=':
+            mask &= (s <= value).to_numpy()
+        elif op == '>':
+            mask &= (s > value).to_numpy()
+        elif op == '>=':
+            mask &= (s >= value).to_numpy()
+        elif op == 'in':
+            mask &= s.isin(value).to_numpy()
+        elif op == 'not in':
+            mask &= ~s.isin(value).to_numpy()
+        else:
+            raise ValueError(f"Unsupported filter op: {op}")
+    return df[mask]
+
+
+class LazySource():
+    """
+    Data that is only read at draw() time: `load(columns, filters)` returns a DataFrame with
+    just `columns` (None = all) and rows matching pyarrow-style `(column, op, value)` filters.
+    """
+    def columns(self):
+        raise NotImplementedError
+
+    def load(self, columns=None, filters=()):
+        raise NotImplementedError
+
+
+class ArrowSource(LazySource):
+    """
+    Parquet file / directory / pyarrow Dataset or Table, scanned with column projection and
+    filter pushdown (row groups that cannot match are skipped).
+    """
+    def __init__(self, source, filters=()):
+        import pyarrow.dataset as ds
+
+        self.dataset = source if isinstance(source, ds.Dataset) else ds.dataset(source)
+        self.filters = list(filters)
+
+    def columns(self):
+        return self.dataset.schema.names
+
+    def load(self, columns=None, filters=()):
+        import pyarrow.parquet as pq
+
+        filters = self.filters + list(filters)
+        expr = pq.filters_to_expression(filters) if filters else None
+        return self.dataset.to_table(columns=columns, filter=expr).to_pandas()
+
+
+class SqlSource(LazySource):
+    """
+    A table (`name` or `schema.name`) or query read through a PostgreSQLDB, so the reads are
+    profiled like any other exedf(); only the needed columns are selected and filters become
+    bound WHERE conditions. Objects with only a SQLAlchemy `.engine` are queried directly.
+    """
+    def __init__(self, db, table=None, query=None, filters=()):
+        if (table is None) == (query is None):
+            raise ValueError("SqlSource needs exactly one of table= or query=")
+        self.db = db
+        self.from_clause = _quote_identifier(table) if table is not None else f"({query.strip().rstrip(';')}) AS src"
+        self.filters = list(filters)
+        self._columns = None
+
+    def _execute(self, sql, params):
+        if hasattr(self.db, 'exedf'):
+            return self.db.exedf(sql, params=params)
+
+        from sqlalchemy import bindparam, text
+
+        stmt = text(sql)
+        for name, value in params.items():
+            if isinstance(value, (list, tuple, set)):
+                stmt = stmt.bindparams(bindparam(name, expanding=True))
+        with self.db.engine.connect() as conn:
+            result = conn.execute(stmt, params)
+            return pd.DataFrame(result.fetchall(), columns=list(result.keys()))
+
+    def columns(self):
+        if self._columns is None:
+            self._columns = list(self._execute(f"SELECT * FROM {self.from_clause} LIMIT 0", {}).columns)
+        return self._columns
+
+    def load(self, columns=None, filters=()):
+        select = ", ".join(_quote_identifier(c) for c in columns) if columns else "*"
+        where, params = [], {}
+        for i, (col, op, value) in enumerate(self.filters + list(filters)):
+            if op not in SQL_FILTER_OPS:
+                raise ValueError(f"Unsupported filter op: {op}")
+            name = f"f{i}"
+            where.append(f"{_quote_identifier(col)} {SQL_FILTER_OPS[op]} :{name}")
+            params[name] = list(value) if op in ('in', 'not in') else value
+        sql = f"SELECT {select} FROM {self.from_clause}"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        return self._execute(sql, params)
+
+
 class DataMixin():
     def __init__(self):
         super().__init__()
+        self.filters = []
+        self._source_key = None
         self.data = self._data_process(self.data)
 
     def _data_process(self, data):
+        self.source = None
         if data is None:
             self.data = None
+        elif isinstance(data, LazySource):
+            self.source = data
+            self.data = None
+        elif isinstance(data, str) and data.lower().endswith('.parquet'):
+            self.source = ArrowSource(data)
+            self.data = None
+        elif 'pyarrow' in str(type(data)):
+            self.source = ArrowSource(data)
+            self.data = None
         elif isinstance(data, dict):
             self.data = pd.DataFrame(data)
-        elif 'pandas' in str(type(data)):
-            self.data = data.copy()
-        elif isinstance(data, list):
+        elif isinstance(data, (list, np.ndarray)):
             self.data = self._process_list_data(data)
+        elif 'pandas' in str(type(data)):
+            # Gg 는 입력 DataFrame 을 변경하지 않으므로 복사하지 않는다
+            self.data = data
         else:
-            raise TypeError("data must be dict, pandas DataFrame, or list")
+            raise TypeError("data must be dict, pandas DataFrame, numpy ndarray, list, Parquet path, Arrow table or LazySource")
+        if self.source is None and self.data is not None and self.filters:
+            self.data = _filter_frame(self.data, self.filters)
         return self.data
 
-    def _process_list_data(self, data):
-        coord_val_pairs, ndim = self._parse_array_to_coords_and_values(data)
-        coords = [coord for coord, _ in coord_val_pairs]
-        values = [val for _, val in coord_val_pairs]
+    def where(self, *filters):
+        """
+        Add `(column, op, value)` filters; pushed down to a lazy source, applied at once to
+        in-memory data. Either way they are kept and re-applied to data passed to update().
+        """
+        filters = [tuple(f) for f in filters]
+        self.filters.extend(filters)
+        if self.source is None and self.data is not None:
+            self.data = _filter_frame(self.data, filters)
+        return self
+
+    def _needed_columns(self):
+        if getattr(self, 'geom', None) in WHOLE_FRAME_GEOMS or not self.mapping:
+            return None
+        available = set(self.source.columns())
+        columns = [c for c in self.mapping.values() if isinstance(c, str) and c in available]
+        return list(dict.fromkeys(columns)) or None
 
+    def _load_source(self):
+        """
+        Read the lazy source with only the mapped columns; reused while columns/filters are unchanged.
+        """
+        if self.source is None:
+            return
+        columns = self._needed_columns()
+        key = (tuple(columns) if columns else None, json.dumps(self.filters, default=str))
+        if key != self._source_key:
+            self.data = self.source.load(columns, self.filters)
+            self._source_key = key
+
+    def _process_list_data(self, data):
+        coords, values, ndim = self._parse_array_to_coords_and_values(data)
         coord_cols = self._generate_dim_names(ndim)
-        df = pd.DataFrame(coords, columns=coord_cols)
-        df['value'] = values
-        return df
+        columns = dict(zip(coord_cols, coords))
+        columns['value'] = values
+        return pd.DataFrame(columns, copy=False)
 
     def _parse_array_to_coords_and_values(self, data):
-        arr = np.array(data)
+        arr = np.asarray(data)
 
         if arr.dtype == object:
             raise ValueError("입력된 리스트는 정규 다차원 배열이 아닙니다. 내부 리스트 길이가 모두 같아야 합니다.")
 
-        coord_val_pairs = []
+        # 축마다 arange 를 해당 축 방향으로만 세운 뒤 전체 shape 로 broadcast → C 순서로 펼침
+        shape = arr.shape
+        coords = []
+        for axis, n in enumerate(shape):
+            index_shape = [1] * arr.ndim
+            index_shape[axis] = n
+            axis_index = np.arange(n, dtype=np.intp).reshape(index_shape)
+            coords.append(np.broadcast_to(axis_index, shape).ravel())
 
-        for idx in np.ndindex(arr.shape):
-            val = arr[idx]
-            coord_val_pairs.append(((idx), val))
+        # 연속 배열이면 ravel 은 복사 없이 view 를 돌려준다
+        values = arr.ravel()
 
-        return coord_val_pairs, len(arr.shape)
+        return coords, values, arr.ndim
 
     def _generate_dim_names(self, n):
         base_names = ['x', 'y', 'z']
@@ -69,388 +567,908 @@ class GeomMixin():
     def __init__(self):
         super().__init__()
         self.geom = None
-        self.geom_engine_map = {
-            'bar': 'matplotlib',
-            'point': 'matplotlib',
-            'stacked': 'matplotlib',
-            'histogram': 'matplotlib',
-            'line': 'matplotlib',
-            'scatter': 'matplotlib',
-            'box': 'matplotlib',
-            'pie': 'matplotlib',
-            'heat': 'matplotlib',
-            'area': 'matplotlib',
-            'stream': 'matplotlib',
-            'confuse': 'matplotlib',
-            'duration': 'matplotlib',
-            'violin': 'seaborn',
-            'pair': 'seaborn',
-            'density': 'seaborn',
-            'bubble': 'matplotlib',
-            'decision': 'console',
-            'decomposition': 'console',
-            'event': 'console',
-            'spider': 'plotly',
-            'treemap': 'plotly',
-            'chord': 'plotly',
-            'sankey': 'plotly',
-            'network': 'networkx',
-            'icicle': 'plotly',
-            'parallel': 'plotly',
-            'surface': 'plotly',
-        }
-        self.goem_engine = None
+        self.geom_engine = None
+
+    def set_geom(self, geom):
+        self.geom = geom
+        self.geom_engine = GEOMS.engine(self.geom)
+        return self
 
     def geom_bar(self):
-        self.geom = 'bar'
-        self.geom_engine = self.geom_engine_map.get(self.geom, 'unknown')
-        if self.data is None:
+        self.set_geom('bar')
+        if self.data is None and self.source is None:
             example_data = {'category': ['A', 'B', 'C'], 'value': np.random.randint(5, 20, 3)}
             self.data = pd.DataFrame(example_data)
             self.mapping = {'x': 'category', 'y': 'value'}
         return self
     def geom_point(self):
-        self.geom = 'point'
-        self.geom_engine = self.geom_engine_map.get(self.geom, 'unknown')
-        if self.data is None:
+        self.set_geom('point')
+        if self.data is None and self.source is None:
             example_data = {'x': list(range(10)), 'y': np.random.randint(0, 100, 10)}
             self.data = pd.DataFrame(example_data)
             self.mapping = {'x': 'x', 'y': 'y'}
         return self
     def geom_line(self):
-        self.geom = 'line'
-        self.geom_engine = self.geom_engine_map.get(self.geom, 'unknown')
-        if self.data is None:
+        self.set_geom('line')
+        if self.data is None and self.source is None:
             example_data = {'time': list(range(20)), 'value': np.cumsum(np.random.randn(20))}
             self.data = pd.DataFrame(example_data)
             self.mapping = {'x': 'time', 'y': 'value'}
         return self
     # ... (다른 geom 메서드도 이 파일에 추가) ...
 
-class ThemeMixin():
-    def __init__(self):
-        super().__init__()
-        self.theme = {}
-        
-    def set_theme_from_yaml(self, theme_name, yaml_path=r'C:\Users\parkj\Documents\workspace\my_projects\0_basic\gg_theme.yml'):
-        with open(yaml_path, 'r', encoding='utf-8') as f:
-            theme_data = yaml.safe_load(f)
-        if theme_name not in theme_data:
-            raise ValueError(f"Theme '{theme_name}' not found in {yaml_path}")
-        self.theme = theme_data[theme_name]
-        return self
-
-    def theme_minimal(self): return self.set_theme_from_yaml("minimal")
-    def theme_dark(self): return self.set_theme_from_yaml("dark")
-    def theme_modern(self): return self.set_theme_from_yaml("modern")
-    def theme_presentation(self): return self.set_theme_from_yaml("presentation")
-    def theme_basic(self): return self.set_theme_from_yaml("basic")
+def parse_rgba_string(rgba_str):
+    if isinstance(rgba_str, str) and rgba_str.startswith('rgba'):
+        rgba_str = rgba_str[5:-1]  # 'rgba('와 ')' 제거
+        r, g, b, a = map(float, rgba_str.split(','))
+        return (r/255, g/255, b/255, a)
+    return rgba_str  # 이미 튜플이거나 문자열이면 그대로
 
-class DrawMixin(GeomMixin, ThemeMixin):
-    def __init__(self):
-        super().__init__()
-        self.ax = None
-        self.last_fig = None
 
-    def draw(self):
-        if self.geom_engine in ['matplotlib', 'seaborn']:
-            self._apply_theme_matplotlib()
-            self._apply_text_matplotlib()
-            self._draw_matplotlib_based()
-        elif self.geom_engine == 'plotly':
-            self._draw_plotly_based()
-        elif self.geom_engine == 'networkx':
-            self._draw_networkx_based()
-        elif self.geom_engine == 'console':
-            self._draw_console_based()
-        else:
-            raise ValueError(f"Unknown geom engine: {self.geom_engine}")
-        return self
-
-    def _parse_rgba_string(self, rgba_str):
-        if isinstance(rgba_str, str) and rgba_str.startswith('rgba'):
-            rgba_str = rgba_str[5:-1]  # 'rgba('와 ')' 제거
-            r, g, b, a = map(float, rgba_str.split(','))
-            return (r/255, g/255, b/255, a)
-        return rgba_str  # 이미 튜플이거나 문자열이면 그대로
+def theme_key(theme):
+    """
+    Content hash of a theme dict; a Gg recompiles its theme when this changes.
+    """
+    return hashlib.sha256(json.dumps(theme, sort_keys=True, default=str).encode('utf-8')).hexdigest()
 
 
-    def _apply_theme_matplotlib(self):
-        theme = self.theme
-        bg = theme.get('background', 'white')
-        bg = self._parse_rgba_string(bg) if isinstance(bg, str) else bg
-        plt.figure(facecolor=bg)
+class CompiledTheme():
+    """
+    A theme dict resolved once into an rc dict and the per-geom style dicts used by DrawMixin.
+    """
+    def __init__(self, theme):
+        self.source = theme
+        self.key = theme_key(theme)
+        self.facecolor = parse_rgba_string(theme.get('background', 'white'))
         font = theme.get('font', {})
-        mpl.rcParams['font.family'] = font.get('family', 'Arial')
-        mpl.rcParams['font.size'] = font.get('size', 12)
-        self.ax = plt.gca()
-        if theme.get('grid', False):
-            self.ax.grid(True, color=theme.get('grid_color', 'lightgray'))
-        else:
-            self.ax.grid(False)
+        self.font_color = font.get('color', 'black')
+        # draw()/save() 동안에만 rc_context 로 적용 → 전역 rcParams 를 바꾸지 않는다
+        self.rc = {
+            'font.family': font.get('family', 'Arial'),
+            'font.size': font.get('size', 12),
+            'figure.facecolor': self.facecolor,
+        }
+        self.grid = theme.get('grid', False)
+        self.grid_color = theme.get('grid_color', 'lightgray')
         axis = theme.get('axis', {})
-        if not axis.get('show', True):
-            self.ax.axis('off')
-        else:
-            self.ax.axis('on')
-        for spine in self.ax.spines.values():
-            spine.set_color(axis.get('color', 'black'))
-            spine.set_linewidth(axis.get('linewidth', 1))
-        self.ax.tick_params(
-            axis='both',
-            which='both',
-            length=3 if axis.get('ticks', True) else 0,
-            color=axis.get('color', 'black')
-        )
+        self.axis_show = axis.get('show', True)
+        self.axis_color = axis.get('color', 'black')
+        self.axis_linewidth = axis.get('linewidth', 1)
+        self.tick_length = 3 if axis.get('ticks', True) else 0
         title = theme.get('title', {})
-        self._title_conf = {
+        self.title_conf = {
             "show": title.get('show', True),
             "size": title.get('size', 14),
             "weight": title.get('weight', 'bold'),
             "color": title.get('color', 'black')
         }
         legend = theme.get('legend', {})
-        self._legend_conf = {
+        self.legend_conf = {
             "show": legend.get('show', True),
             "loc": legend.get('location', 'best'),
             "fontsize": legend.get('font_size', 10)
         }
         bar = theme.get('bar', {})
-        self._bar_conf = {
+        self.bar_conf = {
             "color": bar.get('color', 'skyblue'),
             "edgecolor": bar.get('edge_color', 'black'),
             "width": bar.get('width', 0.8)
         }
         line = theme.get('line', {})
-        self._line_conf = {
+        self.line_conf = {
             "color": line.get('color', 'blue'),
             "width": line.get('width', 2),
             "style": line.get('style', 'solid')
         }
         scatter = theme.get('scatter', {})
-        self._scatter_conf = {
+        self.scatter_conf = {
             "alpha": scatter.get('alpha', 0.8),
             "colormap": scatter.get('colormap', 'viridis')
         }
         pie = theme.get('pie', {})
-        self._pie_conf = {
+        self.pie_conf = {
             "autopct": pie.get('autopct', '%1.1f%%'),
             "startangle": pie.get('startangle', 90)
         }
         violin = theme.get('violin', {})
-        self._violin_conf = {
+        self.violin_conf = {
             "inner": violin.get('inner', 'box')
         }
         heatmap = theme.get('heatmap', {})
-        self._heatmap_conf = {
+        self.heatmap_conf = {
             "cmap": heatmap.get('cmap', 'coolwarm'),
             "annot": heatmap.get('annot', False)
         }
 
+
+def _validate_themes(theme_data, yaml_path):
+    global _theme_schema
+    if _theme_schema is None:
+        with open(THEME_SCHEMA_PATH, 'r', encoding='utf-8') as f:
+            _theme_schema = json.load(f)
+    for name, theme in theme_data.items():
+        try:
+            jsonschema.validate(theme, _theme_schema)
+        except jsonschema.ValidationError as e:
+            raise ValueError(f"Theme '{name}' in {yaml_path} is invalid: {e.message}") from e
+
+
+def load_themes(yaml_path=THEME_PATH):
+    """
+    Parse, validate and compile every theme in `yaml_path` once per file modification.
+    """
+    path = os.path.abspath(yaml_path)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _theme_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(path, 'r', encoding='utf-8') as f:
+        theme_data = yaml.safe_load(f)
+    _validate_themes(theme_data, yaml_path)
+    compiled = {name: CompiledTheme(theme) for name, theme in theme_data.items()}
+    _theme_cache[path] = (mtime, compiled)
+    return compiled
+
+
+class ThemeMixin():
+    def __init__(self):
+        super().__init__()
+        self.theme = {}
+        self._compiled_theme = None
+
+    def set_theme_from_yaml(self, theme_name, yaml_path=THEME_PATH):
+        themes = load_themes(yaml_path)
+        if theme_name not in themes:
+            raise ValueError(f"Theme '{theme_name}' not found in {yaml_path}")
+        # 캐시된 테마는 프로세스 전체가 공유하므로 각 Gg 는 자기 사본을 고친다
+        self._compiled_theme = themes[theme_name]
+        self.theme = copy.deepcopy(self._compiled_theme.source)
+        return self
+
+    def _get_compiled_theme(self):
+        # self.theme 의 내용이 바뀐 경우에만 다시 컴파일
+        if self._compiled_theme is None or self._compiled_theme.key != theme_key(self.theme):
+            self._compiled_theme = CompiledTheme(copy.deepcopy(self.theme))
+        return self._compiled_theme
+
+    def theme_minimal(self): return self.set_theme_from_yaml("minimal")
+    def theme_dark(self): return self.set_theme_from_yaml("dark")
+    def theme_modern(self): return self.set_theme_from_yaml("modern")
+    def theme_presentation(self): return self.set_theme_from_yaml("presentation")
+    def theme_basic(self): return self.set_theme_from_yaml("basic")
+
+def _as_numeric(values):
+    """
+    float64 view of numeric / datetime values for index selection, or None when not possible.
+    """
+    arr = np.asarray(values)
+    if np.issubdtype(arr.dtype, np.datetime64) or np.issubdtype(arr.dtype, np.timedelta64):
+        return arr.astype('int64').astype('float64')
+    if np.issubdtype(arr.dtype, np.number) or arr.dtype == bool:
+        return arr.astype('float64', copy=False)
+    return None
+
+
+def minmax_indices(x, y, n_bins, runs=None):
+    """
+    M4 decimation: per x-bin keep the first, min, max and last point (x sorted, finite).
+    A line through these points is pixel-identical to the full line when n_bins ~ plot width.
+    `runs` (non-decreasing ids, e.g. gap-free stretches) also splits bins where the id changes.
+    """
+    span = x[-1] - x[0]
+    if span <= 0 and runs is None:
+        return np.array([0, len(x) - 1])
+    bins = np.minimum(((x - x[0]) / (span or 1) * n_bins).astype(np.int64), n_bins - 1)
+    change = bins[1:] != bins[:-1]
+    if runs is not None:
+        change |= runs[1:] != runs[:-1]
+    starts = np.flatnonzero(np.r_[True, change])
+    ends = np.r_[starts[1:], len(x)] - 1
+    # 구간 번호가 정렬되어 있으므로 (구간, y) 로 정렬하면 구간별 첫/끝 원소가 최소/최대
+    segments = np.cumsum(np.r_[False, change])
+    order = np.lexsort((y, segments))
+    return np.unique(np.concatenate([starts, ends, order[starts], order[ends]]))
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets: keep the point forming the largest triangle per bucket.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt_lo, nxt_hi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[nxt_lo:nxt_hi].mean()
+        avg_y = y[nxt_lo:nxt_hi].mean()
+        area = np.abs(
+            (x[prev] - avg_x) * (y[lo:hi] - y[prev]) - (x[prev] - x[lo:hi]) * (avg_y - y[prev])
+        )
+        prev = lo + int(np.argmax(area))
+        keep[i + 1] = prev
+    return keep
+
+
+class StatMixin():
+    """
+    ggplot-style stat transforms. The stat is applied lazily at draw time with vectorized
+    NumPy/pandas reductions and cached per (data, mapping, stat), so redraws and theme
+    changes reuse the reduced frame. Draw functions read `plot_data` / `plot_mapping`.
+    """
+    def __init__(self):
+        super().__init__()
+        self.stat = None  # (name, params) 또는 None
+        self._stat_cache = {}
+
+    def stat_bin(self, bins=30, range=None):
+        """
+        Histogram of the x column: x (bin centre), count, width.
+        """
+        self.stat = ('bin', {'bins': bins, 'range': range})
+        return self
+
+    def stat_count(self):
+        """
+        Number of rows per distinct x: x, count.
+        """
+        self.stat = ('count', {})
+        return self
+
+    def stat_summary(self, fun='mean'):
+        """
+        y aggregated per distinct x with `fun` ('mean', 'median', 'sum', 'min', 'max', ...).
+        """
+        self.stat = ('summary', {'fun': fun})
+        return self
+
+    def stat_bin2d(self, bins=30, range=None):
+        """
+        2-D histogram of x/y in long format: x, y (bin centres), value (count), for heat.
+        """
+        self.stat = ('bin2d', {'bins': bins, 'range': range})
+        return self
+
+    def _cached_stat(self, key, func, data):
+        key = (id(data), json.dumps(self.mapping, sort_keys=True, default=str), key)
+        entry = self._stat_cache.get(key)
+        if entry is not None and entry[0]() is data:
+            return entry[1]
+        # 입력 frame 은 약한 참조로만 들고 있으므로, 버려진 data(update() 이전 frame 등)의 항목은 정리
+        self._stat_cache = {k: v for k, v in self._stat_cache.items() if v[0]() is not None}
+        if len(self._stat_cache) >= 8:
+            self._stat_cache.clear()
+        result = func(data)
+        # 약한 참조로 id 재사용 오탐을 막되 data 자체를 붙잡아 두지 않는다
+        self._stat_cache[key] = (weakref.ref(data), result)
+        return result
+
+    def _apply_stat(self, df):
+        name, params = self.stat
+        mapping = self.mapping
+        if name == 'bin':
+            values = np.asarray(df[mapping['x']], dtype='float64')
+            counts, edges = np.histogram(values[np.isfinite(values)], bins=params['bins'], range=params['range'])
+            return pd.DataFrame({'x': (edges[:-1] + edges[1:]) / 2, 'count': counts, 'width': np.diff(edges)})
+        if name == 'count':
+            counts = df[mapping['x']].value_counts(sort=False).sort_index()
+            return pd.DataFrame({mapping['x']: counts.index, 'count': counts.to_numpy()})
+        if name == 'summary':
+            return (
+                df.groupby(mapping['x'], sort=True, observed=True)[mapping['y']]
+                .agg(params['fun'])
+                .reset_index()
+            )
+        if name == 'bin2d':
+            x = np.asarray(df[mapping['x']], dtype='float64')
+            y = np.asarray(df[mapping['y']], dtype='float64')
+            finite = np.isfinite(x) & np.isfinite(y)
+            counts, xe, ye = np.histogram2d(x[finite], y[finite], bins=params['bins'], range=params['range'])
+            xc = (xe[:-1] + xe[1:]) / 2
+            yc = (ye[:-1] + ye[1:]) / 2
+            return pd.DataFrame({
+                'x': np.broadcast_to(xc[:, None], counts.shape).ravel(),
+                'y': np.broadcast_to(yc[None, :], counts.shape).ravel(),
+                'value': counts.ravel(),
+            })
+        raise ValueError(f"Unknown stat: {name}")
+
+    @property
+    def plot_data(self):
+        if self.stat is None or self.data is None:
+            return self.data
+        return self._cached_stat(
+            ('stat', self.stat[0], json.dumps(self.stat[1], sort_keys=True, default=str)),
+            self._apply_stat,
+            self.data,
+        )
+
+    @property
+    def plot_mapping(self):
+        if self.stat is None:
+            return self.mapping
+        name = self.stat[0]
+        mapping = dict(self.mapping)
+        if name == 'bin':
+            mapping.update(x='x', y='count', width='width')
+        elif name == 'count':
+            mapping['y'] = 'count'
+        elif name == 'bin2d':
+            mapping.update(x='x', y='y', value='value')
+        return mapping
+
+
+class DrawMixin(GeomMixin, StatMixin, ThemeMixin):
+    def __init__(self):
+        super().__init__()
+        self.ax = None
+        self.point_budget = 10_000  # 이보다 많은 점은 축약해서 그린다 (None = 끄기)
+        self.downsample_method = 'minmax'
+        self.figure = None  # 지정하면 새 figure 대신 이 figure 를 비우고 다시 사용 (close() 해도 닫지 않음)
+        self._owns_figure = False
+        self.artists = {}  # update() 가 데이터를 바꿔 끼울 artist (geom 별 draw 함수가 채움)
+        self.last_fig = None
+
+    def draw(self):
+        """
+        Draw the geom. With a render cache (see cache()) the drawing is deferred to save(), so a
+        cache hit never draws; reading `ax` or `figure` before that draws on first access.
+        """
+        renderer = GEOMS.renderer(self.geom_engine)
+        self._load_source()
+        if getattr(self, 'render_cache', None) is not None and renderer.cacheable:
+            # 캐시가 있으면 save() 에서 miss 일 때만 실제로 그린다
+            self._draw_pending = True
+        else:
+            renderer.draw(self)
+        return self
+
+    def _ensure_drawn(self):
+        if getattr(self, '_draw_pending', False):
+            self._draw_pending = False
+            GEOMS.renderer(self.geom_engine).draw(self)
+
+    # 캐시로 미뤄 둔 그리기는 ax/figure 를 처음 읽을 때 수행 → draw() 직후 g.ax.set_xlim(...) 도 동작
+    @property
+    def ax(self):
+        self._ensure_drawn()
+        return self._ax
+
+    @ax.setter
+    def ax(self, value):
+        self._ax = value
+
+    @property
+    def figure(self):
+        self._ensure_drawn()
+        return self._figure
+
+    @figure.setter
+    def figure(self, value):
+        self._figure = value
+
+    def update(self, data):
+        """
+        Swap in new data and update the drawn artists in place (set_data / set_offsets /
+        bar heights) on the same Figure; geoms without an updater are redrawn on it.
+        """
+        self._ensure_drawn()
+        self._data_process(data)
+        self._source_key = None
+        self._load_source()
+        GEOMS.renderer(self.geom_engine).update(self)
+        return self
+
+    def _ensure_figure(self, facecolor=None):
+        """
+        Create the Figure/Axes once and clear them on later draws instead of opening new figures.
+        """
+        if self.figure is None:
+            self.figure = plt.figure(facecolor=facecolor)
+            self._owns_figure = True
+        else:
+            self.figure.clf()
+            if facecolor is not None:
+                self.figure.set_facecolor(facecolor)
+        self.ax = self.figure.add_subplot()
+        self.artists = {}
+        return self.ax
+
+    def close(self):
+        """
+        Close the Figure created by this object (a figure passed in via `figure` is left open).
+        """
+        if self._figure is not None and self._owns_figure:
+            plt.close(self._figure)
+        self.figure = None
+        self._owns_figure = False
+        self.ax = None
+        self.artists = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def downsample(self, budget=10_000, method='minmax'):
+        """
+        Set the point budget for line/area ('minmax' or 'lttb') and scatter/point (2-D binning).
+        """
+        if method not in ('minmax', 'lttb'):
+            raise ValueError("method must be 'minmax' or 'lttb'")
+        self.point_budget = budget
+        self.downsample_method = method
+        return self
+
+    def _reduce_line(self, x, y):
+        """
+        Return (x, y) reduced to about `point_budget` points when x is numeric and sorted.
+        Each gap-free run is reduced on its own and one NaN/inf row is kept per gap, so the
+        line stays broken where the data is missing.
+        """
+        budget = self.point_budget
+        if budget is None or len(x) <= budget:
+            return x, y
+        xn, yn = _as_numeric(x), _as_numeric(y)
+        if xn is None or yn is None:
+            return x, y
+        idx_finite = np.flatnonzero(np.isfinite(xn) & np.isfinite(yn))
+        xn, yn = xn[idx_finite], yn[idx_finite]
+        if len(xn) < 2 or np.any(np.diff(xn) < 0):
+            return x, y  # 정렬되지 않은 x 는 그린 순서가 의미 있으므로 그대로
+        # 유한값 사이에 빠진 행이 있으면 새 run; 각 gap 의 첫 행을 남겨 선을 끊는다
+        breaks = np.flatnonzero(np.diff(idx_finite) > 1)
+        runs = np.r_[0, np.cumsum(np.diff(idx_finite) > 1)] if len(breaks) else None
+        if self.downsample_method == 'lttb':
+            if runs is None:
+                idx = lttb_indices(xn, yn, budget)
+            else:
+                # run 마다 길이 비례 몫의 점; 몫보다 짧은 run 은 전부 남긴다
+                bounds = np.r_[0, breaks + 1, len(xn)]
+                lengths = np.diff(bounds)
+                n_out = np.maximum(budget * lengths // len(xn), 3)
+                idx = np.concatenate([np.flatnonzero(np.repeat(lengths <= n_out, lengths))] + [
+                    bounds[r] + lttb_indices(xn[bounds[r]:bounds[r + 1]], yn[bounds[r]:bounds[r + 1]], n_out[r])
+                    for r in np.flatnonzero(lengths > n_out)
+                ])
+        else:
+            idx = minmax_indices(xn, yn, max(budget // 4, 1), runs)
+        idx = np.union1d(idx_finite[idx], idx_finite[breaks] + 1)
+        return np.asarray(x)[idx], np.asarray(y)[idx]
+
+    @staticmethod
+    def _axis_numeric(values, axis):
+        """
+        Values in the axis' own units: datetimes go through the axis converter (date2num) so the
+        image extent lines up with a date axis, other numerics are used as they are.
+        """
+        arr = np.asarray(values)
+        if np.issubdtype(arr.dtype, np.datetime64):
+            axis.update_units(arr)
+            return np.asarray(axis.convert_units(arr), dtype='float64')
+        return _as_numeric(arr)
+
+    def _draw_density(self, x, y, color, alpha=1.0):
+        """
+        Draw many scatter points as a 2-D histogram image with one bin per ~2 screen pixels.
+        Returns False (nothing drawn) when the data is small or not numeric.
+        """
+        budget = self.point_budget
+        if budget is None or len(x) <= budget:
+            return False
+        xn, yn = self._axis_numeric(x, self.ax.xaxis), self._axis_numeric(y, self.ax.yaxis)
+        if xn is None or yn is None:
+            return False
+        finite = np.isfinite(xn) & np.isfinite(yn)
+        xn, yn = xn[finite], yn[finite]
+        bbox = self.ax.get_window_extent()
+        bins = (max(int(bbox.width // 2), 1), max(int(bbox.height // 2), 1))
+        counts, xe, ye = np.histogram2d(xn, yn, bins=bins)
+        cmap = mpl.colors.LinearSegmentedColormap.from_list(
+            'gg_density', [mpl.colors.to_rgba(color, 0.35 * alpha), mpl.colors.to_rgba(color, alpha)]
+        )
+        self.artists['image'] = self.ax.imshow(
+            np.ma.masked_equal(counts.T, 0),
+            origin='lower',
+            extent=(xe[0], xe[-1], ye[0], ye[-1]),
+            aspect='auto',
+            interpolation='nearest',
+            cmap=cmap,
+            norm=mpl.colors.LogNorm(vmin=1, vmax=max(counts.max(), 1)),
+        )
+        return True
+
+    def _parse_rgba_string(self, rgba_str):
+        return parse_rgba_string(rgba_str)
+
+
+    def _apply_theme_matplotlib(self):
+        theme = self._get_compiled_theme()
+        self._ensure_figure(theme.facecolor)
+        if theme.grid:
+            self.ax.grid(True, color=theme.grid_color)
+        else:
+            self.ax.grid(False)
+        if not theme.axis_show:
+            self.ax.axis('off')
+        else:
+            self.ax.axis('on')
+        for spine in self.ax.spines.values():
+            spine.set_color(theme.axis_color)
+            spine.set_linewidth(theme.axis_linewidth)
+        self.ax.tick_params(
+            axis='both',
+            which='both',
+            length=theme.tick_length,
+            color=theme.axis_color,
+            # 눈금 라벨은 저장 시점에 만들어지므로 폰트를 명시해 rc_context 밖에서도 유지
+            labelsize=theme.rc['font.size'],
+            labelfontfamily=theme.rc['font.family'],
+        )
+        self._title_conf = theme.title_conf
+        self._legend_conf = theme.legend_conf
+        self._bar_conf = theme.bar_conf
+        self._line_conf = theme.line_conf
+        self._scatter_conf = theme.scatter_conf
+        self._pie_conf = theme.pie_conf
+        self._violin_conf = theme.violin_conf
+        self._heatmap_conf = theme.heatmap_conf
+
     def _apply_text_matplotlib(self):
-        font = self.theme.get('font', {})
-        color = font.get('color', 'black')
-        plt.xlabel(self.mapping.get('x', ''), color=color)
-        plt.ylabel(self.mapping.get('y', ''), color=color)
+        color = self._get_compiled_theme().font_color
+        self.ax.set_xlabel(self.plot_mapping.get('x', ''), color=color)
+        self.ax.set_ylabel(self.plot_mapping.get('y', ''), color=color)
         if hasattr(self, '_title_conf') and self._title_conf.get('show', True):
-            plt.title(
+            self.ax.set_title(
                 getattr(self, 'title', ''),
                 fontsize=self._title_conf['size'],
                 fontweight=self._title_conf['weight'],
                 color=self._title_conf['color']
             )
         if hasattr(self, '_legend_conf') and self._legend_conf.get('show', True):
-            handles, labels = plt.gca().get_legend_handles_labels()
+            handles, labels = self.ax.get_legend_handles_labels()
             if labels:
-                plt.legend(
+                self.ax.legend(
                     loc=self._legend_conf['loc'],
                     fontsize=self._legend_conf['fontsize']
                 )
 
-    def _draw_matplotlib_based(self):
-        geom = self.geom
-        df = self.data
-        mapping = self.mapping
-        if geom == 'bar':
-            x = df[mapping['x']]
-            y = df[mapping['y']]
-            conf = self._bar_conf
-            plt.bar(
-                x,
-                y,
-                color=conf['color'],
-                edgecolor=conf['edgecolor'],
-                width=conf['width']
-            )
-        elif geom == 'point':
-            x = df[mapping['x']]
-            y = df[mapping['y']]
-            plt.scatter(x, y, color='tomato')
-            
-        elif geom == 'stacked':
-            x = df[mapping['x']]
-            y1 = df[mapping['y1']]
-            y2 = df[mapping['y2']]
-            plt.bar(x, y1, color='skyblue')
-            plt.bar(x, y2, bottom=y1, color='salmon')
-            
-        elif geom == 'histogram':
-            values = df[mapping['x']]
-            plt.hist(values, bins=10, color='lightgreen', edgecolor='black')
-            
-        elif geom == 'line':
-            x = df[mapping['x']]
-            y = df[mapping['y']]
-            plt.plot(x, y, marker='o', color='blue')
-            
-        elif geom == 'scatter':
-            x = df[mapping['x']]
-            y = df[mapping['y']]
-            plt.scatter(x, y, color='purple')
-            
-        elif geom == 'box':
-            data_cols = [mapping[k] for k in mapping if k.startswith('y')]
-            data_to_plot = [df[col] for col in data_cols]
-            plt.boxplot(data_to_plot, labels=data_cols)
-            
-        elif geom == 'pie':
-            labels = df[mapping['x']]
-            sizes = df[mapping['y']]
-            plt.pie(sizes, labels=labels, autopct='%1.1f%%')
-            
-        elif geom == 'heat':
-            data = df.pivot(index='y', columns='x', values='value')
-            sns.heatmap(data, annot=True, fmt=".2f", cmap="coolwarm")
-            
-        elif geom == 'area':
-            x = df[mapping['x']]
-            y = df[mapping['y']]
-            plt.fill_between(x, y, color='skyblue', alpha=0.4)
-            plt.plot(x, y, color='Slateblue', alpha=0.6)
-            
-        elif geom == 'violin':
-            data_cols = [mapping[k] for k in mapping if k.startswith('y')]
-            data_to_plot = [df[col] for col in data_cols]
-            sns.violinplot(data=data_to_plot)
-            
-        elif geom == 'pair':
-            sns.pairplot(df)
-            
-        elif geom == 'density':
-            sns.kdeplot(df[mapping['x']], shade=True)
-            
-        elif geom == 'stream':
-            for col in df.columns:
-                plt.plot(df.index, df[col], label=col)
-            plt.legend()
-            
-        elif geom == 'confuse':
-            sns.heatmap(df, annot=True, fmt="d", cmap="Blues")
-            
-        elif geom == 'decomposition':
-            plt.plot(df.index, df['trend'], label='Trend')
-            plt.plot(df.index, df['seasonal'], label='Seasonal')
-            plt.plot(df.index, df['residual'], label='Residual')
-            plt.legend()
-            
-        elif geom == 'decision':
-            print("Decision conditions and results:")
-            for idx, row in df.iterrows():
-                print(f"{row[mapping['condition']]} -> {row[mapping['result']]}")
-        else:
-            raise NotImplementedError(f"Draw not implemented for geom {geom}")
-
-    def _draw_plotly_based(self):
-        data = self.data
-        if self.geom == 'spider':
-            import plotly.express as px
-            fig = px.line_polar(data, r=self.mapping['y'], theta=self.mapping['x'], line_close=True)
-            
-        elif self.geom == 'treemap':
-            import plotly.express as px
-            fig = px.treemap(data, path=[self.mapping['x']], values=self.mapping['y'])
-            
-        elif self.geom == 'sankey':
-            import plotly.graph_objects as go
-            data = data
-            fig = go.Figure(go.Sankey(
-                node = dict(label = data['nodes'].tolist()),
-                link = dict(
-                    source = data['source'].tolist(),
-                    target = data['target'].tolist(),
-                    value = data['value'].tolist()
-                )
-            ))
-            
-        elif self.geom == 'icicle':
-            import plotly.express as px
-            fig = px.icicle(data, path=[self.mapping['x']], values=self.mapping['y'])
-            
-        elif self.geom == 'parallel':
-            import plotly.express as px
-            fig = px.parallel_coordinates(data, color=data[self.mapping.get('color', '')])
-            
-        elif self.geom == 'surface':
-            import plotly.graph_objects as go
-            z = data.pivot(index='y', columns='x', values='value').values
-            fig = go.Figure(data=[go.Surface(z=z)])
-            
-        else:
-            raise NotImplementedError(f"Plotly drawing not implemented for self.geom {self.geom}")
-        self.last_fig = fig
-        return
-
-
-    def _draw_networkx_based(self):
-        import networkx as nx
-        import matplotlib.pyplot as plt
-        geom = self.geom
-        data = self.data
-        if geom == 'network':
-            G = nx.Graph()
-            nodes = data['nodes'].tolist()
-            edges = data['edges'].tolist()
-            G.add_nodes_from(nodes)
-            G.add_edges_from(edges)
-            nx.draw(G, with_labels=True)
-            
-        else:
-            raise NotImplementedError(f"NetworkX drawing not implemented for geom {geom}")
-
-    def _draw_console_based(self):
-        geom = self.geom
-        data = self.data
-        if geom == 'decision':
-            pass
-        elif geom == 'event':
-            print("Event Timeline:")
-            for idx, row in data.iterrows():
-                print(f"{row[self.mapping.get('x','time')]} : {row[self.mapping.get('y','event')]}")
-        else:
-            raise NotImplementedError(f"Console drawing not implemented for geom {geom}")
+
+# ───────────────────────────────────────────────
+# geom 별 draw 함수 (engine 은 combi.yml 에서 결정)
+# ───────────────────────────────────────────────
+
+@GEOMS.register('bar', 'matplotlib')
+def _draw_bar(g):
+    df, mapping = g.plot_data, g.plot_mapping
+    x = df[mapping['x']]
+    y = df[mapping['y']]
+    conf = g._bar_conf
+    g.artists['bars'] = g.ax.bar(
+        x,
+        y,
+        color=conf['color'],
+        edgecolor=conf['edgecolor'],
+        width=df[mapping['width']] if 'width' in mapping else conf['width']
+    )
+    g.artists['bar_x'] = np.asarray(x)
+
+@GEOMS.register_update('bar', 'matplotlib')
+def _update_bar(g):
+    # 같은 x 범주면 막대 높이만 바꾸고, 범주가 달라지면 다시 그린다
+    df, mapping = g.plot_data, g.plot_mapping
+    bars = g.artists.get('bars')
+    x = np.asarray(df[mapping['x']])
+    if bars is None or 'width' in mapping or not np.array_equal(x, g.artists['bar_x']):
+        return False
+    heights = np.asarray(df[mapping['y']], dtype=float)
+    for rect, height in zip(bars, heights):
+        rect.set_height(height)
+    # 막대마다 relim() 으로 경로를 다시 계산하지 않고 모서리 좌표로 범위를 잡는다
+    left = np.array([rect.get_x() for rect in bars])
+    right = left + np.array([rect.get_width() for rect in bars])
+    g.ax.ignore_existing_data_limits = True
+    g.ax.update_datalim(np.column_stack([np.r_[left, right], np.r_[np.zeros_like(heights), heights]]))
+
+def _draw_points(g, color):
+    df, mapping = g.plot_data, g.plot_mapping
+    x = df[mapping['x']]
+    y = df[mapping['y']]
+    if not g._draw_density(x, y, color):
+        g.artists['points'] = g.ax.scatter(x, y, color=color)
+
+def _update_points(g):
+    # 점이 budget 을 넘어 밀도 이미지로 바뀌어야 하면 (또는 그 반대) 다시 그린다
+    df, mapping = g.plot_data, g.plot_mapping
+    points = g.artists.get('points')
+    if points is None or (g.point_budget is not None and len(df) > g.point_budget):
+        return False
+    x = g.ax.convert_xunits(np.asarray(df[mapping['x']]))
+    y = g.ax.convert_yunits(np.asarray(df[mapping['y']]))
+    offsets = np.column_stack([x, y])
+    points.set_offsets(offsets)
+    # relim() 은 collection 을 보지 않으므로 데이터 범위를 직접 다시 잡는다
+    g.ax.relim()
+    g.ax.ignore_existing_data_limits = True
+    g.ax.update_datalim(offsets)
+
+@GEOMS.register('point', 'matplotlib')
+def _draw_point(g):
+    _draw_points(g, 'tomato')
+
+@GEOMS.register('stacked', 'matplotlib')
+def _draw_stacked(g):
+    df, mapping = g.plot_data, g.plot_mapping
+    x = df[mapping['x']]
+    y1 = df[mapping['y1']]
+    y2 = df[mapping['y2']]
+    g.ax.bar(x, y1, color='skyblue')
+    g.ax.bar(x, y2, bottom=y1, color='salmon')
+
+@GEOMS.register('histogram', 'matplotlib')
+def _draw_histogram(g):
+    values = g.plot_data[g.plot_mapping['x']]
+    g.ax.hist(values, bins=10, color='lightgreen', edgecolor='black')
+
+@GEOMS.register('line', 'matplotlib')
+def _draw_line(g):
+    df, mapping = g.plot_data, g.plot_mapping
+    x, y = g._reduce_line(df[mapping['x']], df[mapping['y']])
+    g.artists['line'], = g.ax.plot(x, y, marker='o', color='blue')
+
+@GEOMS.register_update('line', 'matplotlib')
+def _update_line(g):
+    df, mapping = g.plot_data, g.plot_mapping
+    line = g.artists.get('line')
+    if line is None:
+        return False
+    line.set_data(*g._reduce_line(df[mapping['x']], df[mapping['y']]))
+    g.ax.relim()
+
+@GEOMS.register('scatter', 'matplotlib')
+def _draw_scatter(g):
+    _draw_points(g, 'purple')
+
+GEOMS.register_update('point', 'matplotlib')(_update_points)
+GEOMS.register_update('scatter', 'matplotlib')(_update_points)
+
+@GEOMS.register('box', 'matplotlib')
+def _draw_box(g):
+    df, mapping = g.plot_data, g.plot_mapping
+    data_cols = [mapping[k] for k in mapping if k.startswith('y')]
+    data_to_plot = [df[col] for col in data_cols]
+    g.ax.boxplot(data_to_plot, labels=data_cols)
+
+@GEOMS.register('pie', 'matplotlib')
+def _draw_pie(g):
+    df, mapping = g.plot_data, g.plot_mapping
+    labels = df[mapping['x']]
+    sizes = df[mapping['y']]
+    g.ax.pie(sizes, labels=labels, autopct='%1.1f%%')
+
+@GEOMS.register('heat', 'matplotlib')
+def _draw_heat(g):
+    # 중복 (x, y) 는 평균으로 합치고, 결과는 stat 캐시에 보관해 다시 그릴 때 재계산하지 않는다
+    mapping = g.plot_mapping
+    x, y, value = mapping.get('x', 'x'), mapping.get('y', 'y'), mapping.get('value', 'value')
+    data = g._cached_stat(
+        ('heat_grid', x, y, value),
+        lambda df: df.pivot_table(index=y, columns=x, values=value, aggfunc='mean', observed=True),
+        g.plot_data,
+    )
+    sns.heatmap(data, annot=True, fmt=".2f", cmap="coolwarm", ax=g.ax)
+
+@GEOMS.register('area', 'matplotlib')
+def _draw_area(g):
+    df, mapping = g.plot_data, g.plot_mapping
+    x, y = g._reduce_line(df[mapping['x']], df[mapping['y']])
+    g.artists['fill'] = g.ax.fill_between(x, y, color='skyblue', alpha=0.4)
+    g.artists['line'], = g.ax.plot(x, y, color='Slateblue', alpha=0.6)
+
+@GEOMS.register_update('area', 'matplotlib')
+def _update_area(g):
+    # 채움 영역은 꼭짓점 수가 바뀌므로 그 artist 하나만 새로 만든다
+    df, mapping = g.plot_data, g.plot_mapping
+    line = g.artists.get('line')
+    if line is None:
+        return False
+    x, y = g._reduce_line(df[mapping['x']], df[mapping['y']])
+    g.artists['fill'].remove()
+    g.artists['fill'] = g.ax.fill_between(x, y, color='skyblue', alpha=0.4)
+    line.set_data(x, y)
+    g.ax.relim()
+
+@GEOMS.register('stream', 'matplotlib')
+def _draw_stream(g):
+    df = g.plot_data
+    for col in df.columns:
+        g.ax.plot(df.index, df[col], label=col)
+    g.ax.legend()
+
+@GEOMS.register('confuse', 'matplotlib')
+def _draw_confuse(g):
+    sns.heatmap(g.plot_data, annot=True, fmt="d", cmap="Blues", ax=g.ax)
+
+@GEOMS.register('decomposition', 'matplotlib')
+def _draw_decomposition(g):
+    df = g.plot_data
+    g.ax.plot(df.index, df['trend'], label='Trend')
+    g.ax.plot(df.index, df['seasonal'], label='Seasonal')
+    g.ax.plot(df.index, df['residual'], label='Residual')
+    g.ax.legend()
+
+@GEOMS.register('decision', 'matplotlib')
+def _draw_decision_text(g):
+    print("Decision conditions and results:")
+    for idx, row in g.plot_data.iterrows():
+        print(f"{row[g.plot_mapping['condition']]} -> {row[g.plot_mapping['result']]}")
+
+@GEOMS.register('violin', 'seaborn')
+def _draw_violin(g):
+    df, mapping = g.plot_data, g.plot_mapping
+    data_cols = [mapping[k] for k in mapping if k.startswith('y')]
+    data_to_plot = [df[col] for col in data_cols]
+    sns.violinplot(data=data_to_plot, ax=g.ax)
+
+@GEOMS.register('pair', 'seaborn')
+def _draw_pair(g):
+    # pairplot 은 자기 figure 를 만들므로 그 figure 를 넘겨받아 save/close 대상으로 삼는다
+    grid = sns.pairplot(g.plot_data)
+    g.close()
+    g.figure, g._owns_figure = grid.figure, True
+    g.ax = grid.axes[0, 0]
+
+@GEOMS.register('density', 'seaborn')
+def _draw_kde(g):
+    sns.kdeplot(g.plot_data[g.plot_mapping['x']], shade=True, ax=g.ax)
+
+@GEOMS.register('spider', 'plotly')
+def _draw_spider(g):
+    import plotly.express as px
+    g.last_fig = px.line_polar(g.plot_data, r=g.plot_mapping['y'], theta=g.plot_mapping['x'], line_close=True)
+
+@GEOMS.register('treemap', 'plotly')
+def _draw_treemap(g):
+    import plotly.express as px
+    g.last_fig = px.treemap(g.plot_data, path=[g.plot_mapping['x']], values=g.plot_mapping['y'])
+
+@GEOMS.register('sankey', 'plotly')
+def _draw_sankey(g):
+    import plotly.graph_objects as go
+    data = g.plot_data
+    g.last_fig = go.Figure(go.Sankey(
+        node = dict(label = data['nodes'].tolist()),
+        link = dict(
+            source = data['source'].tolist(),
+            target = data['target'].tolist(),
+            value = data['value'].tolist()
+        )
+    ))
+
+@GEOMS.register('icicle', 'plotly')
+def _draw_icicle(g):
+    import plotly.express as px
+    g.last_fig = px.icicle(g.plot_data, path=[g.plot_mapping['x']], values=g.plot_mapping['y'])
+
+@GEOMS.register('parallel', 'plotly')
+def _draw_parallel(g):
+    import plotly.express as px
+    g.last_fig = px.parallel_coordinates(g.plot_data, color=g.plot_data[g.plot_mapping.get('color', '')])
+
+@GEOMS.register('surface', 'plotly')
+def _draw_surface(g):
+    import plotly.graph_objects as go
+    z = g.plot_data.pivot(index='y', columns='x', values='value').values
+    g.last_fig = go.Figure(data=[go.Surface(z=z)])
+
+@GEOMS.register('network', 'networkx')
+def _draw_network(g):
+    import networkx as nx
+    G = nx.Graph()
+    nodes = g.plot_data['nodes'].tolist()
+    edges = g.plot_data['edges'].tolist()
+    G.add_nodes_from(nodes)
+    G.add_edges_from(edges)
+    nx.draw(G, ax=g.ax, with_labels=True)
+
+@GEOMS.register('decision', 'console')
+def _draw_decision(g):
+    pass
+
+@GEOMS.register('event', 'console')
+def _draw_event(g):
+    print("Event Timeline:")
+    for idx, row in g.plot_data.iterrows():
+        print(f"{row[g.plot_mapping.get('x','time')]} : {row[g.plot_mapping.get('y','event')]}")
+
 
 class ShowSaveMixin(DrawMixin):
     def __init__(self):
         super().__init__()
-        
+        self.render_cache = None
+
+    def cache(self, render_cache):
+        """
+        Use a RenderCache (or a cache directory path) for save(); call before draw().
+        """
+        if isinstance(render_cache, str):
+            render_cache = RenderCache(render_cache)
+        self.render_cache = render_cache
+        return self
+
+    def fingerprint(self, ext):
+        """
+        Hash of everything that determines the saved file: data of the mapped columns,
+        mapping, geom, resolved theme, title, downsampling settings, output format, and the
+        engine library versions / RENDER_VERSION so upgrades and draw-code changes re-render.
+        For matplotlib engines also the figure size/dpi and the savefig rcParams.
+        """
+        h = hashlib.sha256()
+        renderer = GEOMS.renderer(self.geom_engine)
+        spec = {
+            'geom': self.geom,
+            'engine': self.geom_engine,
+            'mapping': self.mapping,
+            'stat': self.stat,
+            'theme': self._get_compiled_theme().source,
+            'title': getattr(self, 'title', ''),
+            'point_budget': self.point_budget,
+            'downsample_method': self.downsample_method,
+            'format': ext.lower(),
+            'render_version': RENDER_VERSION,
+            'versions': renderer.versions(),
+        }
+        if isinstance(renderer, MatplotlibRenderer):
+            # save() 는 테마 rc 안에서 저장하므로 같은 rc 기준으로 읽는다
+            with mpl.rc_context(self._get_compiled_theme().rc):
+                spec['savefig'] = {k: v for k, v in mpl.rcParams.items() if k.startswith('savefig.')}
+                # 아직 figure 가 없으면 새로 만들 figure 의 크기 (rc 기본값)
+                size, dpi = mpl.rcParams['figure.figsize'], mpl.rcParams['figure.dpi']
+            if self._figure is not None:
+                size, dpi = self._figure.get_size_inches(), self._figure.dpi
+            spec['figure'] = {'size': [float(v) for v in size], 'dpi': float(dpi)}
+        h.update(json.dumps(spec, sort_keys=True, default=str).encode('utf-8'))
+        self._load_source()
+        df = self.data
+        if df is not None:
+            whole = self.geom in WHOLE_FRAME_GEOMS
+            cols = list(df.columns) if whole else list(dict.fromkeys(
+                c for c in self.mapping.values() if isinstance(c, str) and c in df.columns
+            ))
+            frame = df[cols]
+            h.update(json.dumps([(str(c), str(t)) for c, t in frame.dtypes.items()]).encode('utf-8'))
+            h.update(pd.util.hash_pandas_object(frame, index=whole).to_numpy().tobytes())
+        return h.hexdigest()
+
     def show(self):
-        geom_engine = self.geom_engine
-        if geom_engine in ['matplotlib', 'seaborn', 'networkx']:
-            plt.show()
-        elif geom_engine == 'plotly':
-            if self.last_fig is not None:
-                self.last_fig.show()
+        self._ensure_drawn()
+        GEOMS.renderer(self.geom_engine).show(self)
 
     def save(self, path):
-        geom_engine = self.geom_engine
-        if geom_engine in ['matplotlib', 'seaborn', 'networkx']:
-            plt.savefig(path, bbox_inches='tight')
-        elif geom_engine == 'plotly':
-            if self.last_fig is not None:
-                self.last_fig.write_image(path)
+        renderer = GEOMS.renderer(self.geom_engine)
+        if os.path.isfile(path) and os.stat(path).st_nlink > 1:
+            os.remove(path)  # 캐시 파일의 하드 링크에 덮어쓰면 캐시 내용까지 바뀐다
+        if self.render_cache is None or not renderer.cacheable:
+            self._ensure_drawn()
+            renderer.save(self, path)
+            return self
+        ext = os.path.splitext(path)[1]
+        key = self.fingerprint(ext)
+        if self.render_cache.fetch(key, ext, path):
+            return self
+        self._ensure_drawn()
+        renderer.save(self, path)
+        if os.path.exists(path):
+            self.render_cache.store(key, ext, path)
+        return self
 
 class Gg(DataMixin, AesMixin, ShowSaveMixin):
-    def __init__(self, data: pd.DataFrame = None ):
+    def __init__(self, data: 'pd.DataFrame' = None ):
         self.data = data
         super().__init__()
 
@@ -0,0 +1,271 @@
+import json
+import os
+
+import pandas as pd
+from sqlalchemy import bindparam, text
+from sqlalchemy.exc import DBAPIError
+
+from data import PostgreSQLDB
+
+TABLES_SQL = """
+SELECT TABLE_SCHEMA, TABLE_NAME, TABLE_TYPE, TABLE_ROWS, CREATE_TIME, UPDATE_TIME
+FROM information_schema.TABLES
+WHERE TABLE_SCHEMA IN :schemas
+"""
+
+COLUMNS_SQL = """
+SELECT TABLE_SCHEMA, TABLE_NAME, COLUMN_NAME, ORDINAL_POSITION, COLUMN_TYPE, IS_NULLABLE, COLUMN_KEY
+FROM information_schema.COLUMNS
+WHERE TABLE_SCHEMA = :schema AND TABLE_NAME IN :tables
+"""
+
+# 테이블별 스키마 서명: INSTANT/INPLACE ALTER 는 CREATE_TIME 을 바꾸지 않으므로 내용으로 비교한다
+SIGNATURE_COLUMNS_SQL = """
+SELECT TABLE_SCHEMA, TABLE_NAME,
+       CONCAT(COUNT(*), ':', MAX(ORDINAL_POSITION), ':',
+              MD5(GROUP_CONCAT(COLUMN_NAME, ' ', COLUMN_TYPE, ' ', IS_NULLABLE, ' ', COLUMN_KEY
+                               ORDER BY ORDINAL_POSITION SEPARATOR ','))) AS signature
+FROM information_schema.COLUMNS
+WHERE TABLE_SCHEMA IN :schemas
+GROUP BY TABLE_SCHEMA, TABLE_NAME
+"""
+
+SIGNATURE_KEYS_SQL = """
+SELECT TABLE_SCHEMA, TABLE_NAME,
+       GROUP_CONCAT(DISTINCT CONSTRAINT_NAME ORDER BY CONSTRAINT_NAME SEPARATOR ',') AS signature
+FROM information_schema.KEY_COLUMN_USAGE
+WHERE TABLE_SCHEMA IN :schemas
+GROUP BY TABLE_SCHEMA, TABLE_NAME
+"""
+
+KEYS_SQL = """
+SELECT TABLE_SCHEMA, TABLE_NAME, COLUMN_NAME, CONSTRAINT_NAME, ORDINAL_POSITION,
+       REFERENCED_TABLE_SCHEMA, REFERENCED_TABLE_NAME, REFERENCED_COLUMN_NAME
+FROM information_schema.KEY_COLUMN_USAGE
+WHERE TABLE_SCHEMA = :schema AND TABLE_NAME IN :tables
+"""
+
+
+def _iso(value):
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+class CatalogSnapshot:
+    """
+    In-memory index of tables, columns, keys and row estimates for a list of schemas.
+
+    The snapshot is persisted as JSON. `refresh()` reads information_schema.TABLES plus a
+    per-table signature (column count, max ordinal, hash of names/types, constraint names) and
+    re-reads columns/keys only for tables that are new, were re-created (CREATE_TIME changed),
+    have no CREATE_TIME (views) or whose signature changed; `refresh(full=True)` re-reads everything.
+    """
+
+    def __init__(self, db=None, schemas=("bank",), cache_path="catalog_cache.json"):
+        self.db = db
+        self.schemas = list(schemas)
+        self.cache_path = cache_path
+        self.tables = {}  # (schema, table) -> {"type", "rows", "create_time", "update_time"}
+        self._columns = {}  # (schema, table) -> [column dict, ...] (ordinal 순)
+        self._keys = {}  # (schema, table) -> [key column dict, ...]
+        self._fk_graph = {}  # schema -> {table: [fk dict, ...]}
+
+    # ───────────────────────────────────────────────
+    # 조회
+    # ───────────────────────────────────────────────
+
+    def table_names(self, schema, base_only=True):
+        return [
+            t for (s, t), info in self.tables.items()
+            if s == schema and (not base_only or info["type"] == "BASE TABLE")
+        ]
+
+    def columns(self, schema, table):
+        return self._columns.get((schema, table), [])
+
+    def column_names(self, schema, table):
+        return [c["column"] for c in self.columns(schema, table)]
+
+    def primary_key(self, schema, table):
+        return [k["column"] for k in self._keys.get((schema, table), []) if k["constraint"] == "PRIMARY"]
+
+    def row_estimate(self, schema, table):
+        info = self.tables.get((schema, table))
+        return info["rows"] if info else None
+
+    def fk_graph(self, schema):
+        """
+        {table: [{"column", "constraint", "ref_schema", "ref_table", "ref_column"}, ...]} for `schema`.
+        """
+        if schema not in self._fk_graph:
+            graph = {}
+            for (s, table), keys in self._keys.items():
+                if s != schema:
+                    continue
+                fks = [k for k in keys if k["ref_table"] is not None]
+                if fks:
+                    graph[table] = fks
+            self._fk_graph[schema] = graph
+        return self._fk_graph[schema]
+
+    def foreign_key_relations(self, schema):
+        """
+        Same rows as the `foreign_key_relations` view, for any schema.
+        """
+        rows = [
+            (schema, table, fk["column"], fk["ref_schema"], fk["ref_table"], fk["ref_column"])
+            for table, fks in self.fk_graph(schema).items()
+            for fk in fks
+        ]
+        return pd.DataFrame(
+            rows, columns=["fk_schema", "fk_table", "fk_column", "ref_schema", "ref_table", "ref_column"]
+        )
+
+    def table_column(self, schema):
+        """
+        Same rows as the `table_column` view, for any schema.
+        """
+        rows = [(t, c) for t in self.table_names(schema) for c in self.column_names(schema, t)]
+        return pd.DataFrame(rows, columns=["TABLE_NAME", "COLUMN_NAME"])
+
+    # ───────────────────────────────────────────────
+    # 갱신
+    # ───────────────────────────────────────────────
+
+    def _fetch(self, conn, sql, **params):
+        stmt = text(sql)
+        for name, value in params.items():
+            if isinstance(value, (list, tuple)):
+                stmt = stmt.bindparams(bindparam(name, expanding=True))
+        return conn.execute(stmt, params).mappings().all()
+
+    def _is_stale(self, key, info):
+        cached = self.tables.get(key)
+        return (
+            cached is None
+            or info["create_time"] is None
+            or cached["create_time"] != info["create_time"]
+            or cached.get("signature") != info["signature"]
+        )
+
+    def refresh(self, full=False):
+        if self.db is None:
+            raise ValueError("CatalogSnapshot.refresh() needs a PostgreSQLDB")
+        with self.db.engine.connect() as conn:
+            try:
+                # MySQL 8 은 CREATE_TIME/TABLE_ROWS 를 기본 하루 동안 캐시한다
+                conn.exec_driver_sql("SET SESSION information_schema_stats_expiry = 0")
+            except DBAPIError:
+                conn.rollback()  # 5.7 이하: 캐시 없음
+            conn.exec_driver_sql("SET SESSION group_concat_max_len = 1048576")
+            current = {}
+            for row in self._fetch(conn, TABLES_SQL, schemas=self.schemas):
+                current[(row["TABLE_SCHEMA"], row["TABLE_NAME"])] = {
+                    "type": row["TABLE_TYPE"],
+                    "rows": row["TABLE_ROWS"],
+                    "create_time": _iso(row["CREATE_TIME"]),
+                    "update_time": _iso(row["UPDATE_TIME"]),
+                    "signature": "",
+                }
+            for sql in (SIGNATURE_COLUMNS_SQL, SIGNATURE_KEYS_SQL):
+                for row in self._fetch(conn, sql, schemas=self.schemas):
+                    info = current.get((row["TABLE_SCHEMA"], row["TABLE_NAME"]))
+                    if info is not None:
+                        info["signature"] += f"{row['signature']}|"
+
+            stale = [
+                key for key, info in current.items()
+                if full or self._is_stale(key, info)
+            ]
+            for key in set(self.tables) - set(current):
+                self._columns.pop(key, None)
+                self._keys.pop(key, None)
+
+            by_schema = {}
+            for schema, table in stale:
+                by_schema.setdefault(schema, []).append(table)
+            for schema, tables in by_schema.items():
+                for table in tables:
+                    self._columns[(schema, table)] = []
+                    self._keys[(schema, table)] = []
+                for row in self._fetch(conn, COLUMNS_SQL, schema=schema, tables=tables):
+                    self._columns[(schema, row["TABLE_NAME"])].append({
+                        "column": row["COLUMN_NAME"],
+                        "ordinal": row["ORDINAL_POSITION"],
+                        "type": row["COLUMN_TYPE"],
+                        "nullable": row["IS_NULLABLE"] == "YES",
+                        "key": row["COLUMN_KEY"],
+                    })
+                for row in self._fetch(conn, KEYS_SQL, schema=schema, tables=tables):
+                    self._keys[(schema, row["TABLE_NAME"])].append({
+                        "column": row["COLUMN_NAME"],
+                        "constraint": row["CONSTRAINT_NAME"],
+                        "ordinal": row["ORDINAL_POSITION"],
+                        "ref_schema": row["REFERENCED_TABLE_SCHEMA"],
+                        "ref_table": row["REFERENCED_TABLE_NAME"],
+                        "ref_column": row["REFERENCED_COLUMN_NAME"],
+                    })
+                for table in tables:
+                    self._columns[(schema, table)].sort(key=lambda c: c["ordinal"])
+                    self._keys[(schema, table)].sort(key=lambda k: (k["constraint"], k["ordinal"]))
+
+        self.tables = current
+        self._fk_graph = {}
+        print(f"📚 Catalog refreshed: {len(current)} tables, {len(stale)} re-read")
+        return self
+
+    # ───────────────────────────────────────────────
+    # 저장 / 불러오기
+    # ───────────────────────────────────────────────
+
+    def save(self, path=None):
+        path = path or self.cache_path
+        payload = {
+            "schemas": self.schemas,
+            "tables": [
+                {"schema": s, "table": t, **info,
+                 "columns": self._columns.get((s, t), []),
+                 "keys": self._keys.get((s, t), [])}
+                for (s, t), info in self.tables.items()
+            ],
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return self
+
+    def load(self, path=None):
+        path = path or self.cache_path
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+        self.schemas = sorted(set(self.schemas) | set(payload["schemas"]))
+        self.tables, self._columns, self._keys, self._fk_graph = {}, {}, {}, {}
+        for entry in payload["tables"]:
+            key = (entry.pop("schema"), entry.pop("table"))
+            self._columns[key] = entry.pop("columns")
+            self._keys[key] = entry.pop("keys")
+            self.tables[key] = entry
+        return self
+
+    @classmethod
+    def open(cls, db=None, schemas=("bank",), cache_path="catalog_cache.json"):
+        """
+        Load the local snapshot if present, then bring it up to date when a db is given.
+        """
+        snapshot = cls(db, schemas, cache_path)
+        if os.path.exists(cache_path):
+            snapshot.load()
+        if db is not None:
+            snapshot.refresh().save()
+        return snapshot
+
+
+def main():
+    db = PostgreSQLDB()
+    catalog = CatalogSnapshot.open(db, schemas=["bank", "wpp", "fao_all"])
+    print(catalog.foreign_key_relations("bank"))
+    print(catalog.table_column("wpp"))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,154 @@
+import json
+import time
+from collections import deque
+
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import bindparam, create_engine, text
 
 tempsql = r"C:\Users\parkj\Documents\workspace\my_projects\code\temp\temp.sql"
 
+# EXPLAIN 으로 감쌀 수 있는 문장 / EXPLAIN ANALYZE 로 다시 실행해도 안전한 문장
+EXPLAINABLE = ("select", "with", "table", "insert", "update", "delete", "replace")
+ANALYZABLE = ("select", "with", "table")
+
+
+def print_profile(profile):
+    """
+    Default profile log: print one summary line (plus the plan, if captured).
+    """
+    phases = " / ".join(
+        f"{name} {profile[name + '_ms']:.1f}ms"
+        for name in ("connect", "execute", "fetch", "dataframe")
+        if name + "_ms" in profile
+    )
+    print(
+        f"⏱️ [{profile['kind']}] {profile['total_ms']:.1f}ms ({phases}) "
+        f"rows={profile.get('rows')} bytes={profile.get('bytes')}"
+    )
+    if "explain" in profile:
+        print("🐢 Slow query plan:")
+        for row in profile["explain"]:
+            print("   ", row)
+
+
+def jsonl_profile_log(path):
+    """
+    Build a profile log that appends each profile as one JSON line to `path`.
+    """
+
+    def _log(profile):
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(profile, ensure_ascii=False, default=str) + "\n")
+
+    return _log
+
+
+def summarize_profiles(profiles):
+    """
+    Aggregate profiles per SQL text, slowest total time first.
+    """
+    df = pd.DataFrame(list(profiles))
+    if df.empty:
+        return df
+    return (
+        df.groupby("sql")
+        .agg(
+            calls=("total_ms", "size"),
+            total_ms=("total_ms", "sum"),
+            mean_ms=("total_ms", "mean"),
+            max_ms=("total_ms", "max"),
+            rows=("rows", "sum"),
+        )
+        .sort_values("total_ms", ascending=False)
+    )
+
 
 class PostgreSQLDB:
     def __init__(
-        self, host="localhost", database="", user="root", password="1120", port="3306"
+        self,
+        host="localhost",
+        database="",
+        user="root",
+        password="1120",
+        port="3306",
+        profile_log=None,
+        slow_query_ms=None,
+        explain_analyze=False,
+        profile_history=1000,
     ):
+        """
+        profile_log: callable receiving each query profile (dict). Defaults to `print_profile`.
+        slow_query_ms: capture the EXPLAIN plan of queries slower than this (None = never).
+        explain_analyze: use EXPLAIN ANALYZE (re-runs the query) instead of EXPLAIN for reads.
+        profile_history: how many recent profiles to keep in `self.profiles` (0 = none, None = all).
+        """
         self.db_url = f"mysql+pymysql://{user}:{password}@{host}:{port}/{database}"
         self.engine = create_engine(self.db_url)
+        self.profile_log = profile_log if profile_log is not None else print_profile
+        self.slow_query_ms = slow_query_ms
+        self.explain_analyze = explain_analyze
+        self.profiles = deque(maxlen=profile_history)
         print("Database engine created.")
 
-    def exedf(self, query=None, sql_path=None):
-        if sql_path is None:
-            sql_path = tempsql
+    def _load_query(self, query, sql_path, params=None):
         if query is None:
             with open(sql_path, "r", encoding="utf-8") as file:
-                query = text(file.read())
-        else:
-            query = text(query)
+                query = file.read()
+        stmt = text(query)
+        # 리스트 값은 IN (:name) 으로 펼친다
+        for name, value in (params or {}).items():
+            if isinstance(value, (list, tuple, set)):
+                stmt = stmt.bindparams(bindparam(name, expanding=True))
+        return stmt
+
+    def _capture_explain(self, conn, query, profile, params=None):
+        if self.slow_query_ms is None or profile["total_ms"] < self.slow_query_ms:
+            return
+        sql = query.text.strip().rstrip(";")
+        keyword = sql.split(None, 1)[0].lower() if sql else ""
+        if keyword not in EXPLAINABLE:
+            return
+        prefix = "EXPLAIN ANALYZE" if self.explain_analyze and keyword in ANALYZABLE else "EXPLAIN"
+        try:
+            rows = conn.execute(self._load_query(f"{prefix} {sql}", None, params), params or {}).fetchall()
+            profile["explain"] = [dict(row._mapping) for row in rows]
+        except Exception as e:
+            profile["explain_error"] = str(e)
+
+    def _log_profile(self, profile):
+        self.profiles.append(profile)
+        if self.profile_log:
+            self.profile_log(profile)
+
+    def exedf(self, query=None, sql_path=None, params=None):
+        """
+        Run a query and return a DataFrame; `params` are bound `:name` values (lists expand for IN).
+        """
+        if sql_path is None:
+            sql_path = tempsql
+        query = self._load_query(query, sql_path, params)
+        profile = {"kind": "exedf", "sql": str(query)}
+        start = time.perf_counter()
         with self.engine.connect() as conn:
-            result = conn.execute(query)
+            t_connect = time.perf_counter()
+            result = conn.execute(query, params or {})
+            t_execute = time.perf_counter()
             columns = result.keys()
             data = result.fetchall()
+            t_fetch = time.perf_counter()
             df = pd.DataFrame(data, columns=columns)
+            t_df = time.perf_counter()
+            profile.update(
+                connect_ms=(t_connect - start) * 1000,
+                execute_ms=(t_execute - t_connect) * 1000,
+                fetch_ms=(t_fetch - t_execute) * 1000,
+                dataframe_ms=(t_df - t_fetch) * 1000,
+                total_ms=(t_df - start) * 1000,
+                rows=len(df),
+                bytes=int(df.memory_usage(deep=True).sum()),
+            )
+            self._capture_explain(conn, query, profile, params)
+        self._log_profile(profile)
         print("Query executed successfully.")
         return df
 
@@ -32,17 +156,25 @@ class PostgreSQLDB:
         if sql_path is None:
             sql_path = tempsql
         try:
-            if query is None:
-                with open(sql_path, "r", encoding="utf-8") as file:
-                    query = text(file.read())
-            else:
-                query = text(query)
+            query = self._load_query(query, sql_path)
             print("🔍 Executing SQL from file:")
             print("────────────────────────────────────")
             print(query)
             print("────────────────────────────────────")
+            profile = {"kind": "runsql", "sql": str(query)}
+            start = time.perf_counter()
             with self.engine.connect() as conn:
-                conn.execute(query)
+                t_connect = time.perf_counter()
+                result = conn.execute(query)
+                t_execute = time.perf_counter()
+                profile.update(
+                    connect_ms=(t_connect - start) * 1000,
+                    execute_ms=(t_execute - t_connect) * 1000,
+                    total_ms=(t_execute - start) * 1000,
+                    rows=result.rowcount,
+                )
+                self._capture_explain(conn, query, profile)
+            self._log_profile(profile)
 
             print(f"✅ SQL from '{sql_path}' executed successfully.")
 
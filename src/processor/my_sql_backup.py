@@ -2,15 +2,130 @@ import subprocess
 import datetime
 import getpass
 import gzip
-import shutil
+import hashlib
+import json
 import os
+import queue
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
-def backup_and_compress(host, user, schemas, output_dir='.'):
+import pymysql
+
+BLOCK_SIZE = 4 * 1024 * 1024  # 압축 블록 크기 (4 MiB)
+EXTENSIONS = {'gzip': '.sql.gz', 'zstd': '.sql.zst'}
+INSERT_BYTES = 1024 * 1024  # extended INSERT 한 문장의 최대 크기
+MANIFEST = 'manifest.json'
+
+# 복원 시 데이터 파일 앞뒤에 붙이는 bulk-load 세션 설정
+BULK_LOAD_HEADER = b"""SET NAMES utf8mb4;
+SET time_zone = '+00:00';
+SET SESSION unique_checks = 0;
+SET SESSION foreign_key_checks = 0;
+SET SESSION autocommit = 0;
+"""
+BULK_LOAD_FOOTER = b"""
+COMMIT;
+"""
+
+
+class ParallelGzipWriter:
+    """
+    Block-parallel gzip: each block becomes its own gzip member, compressed on a thread pool
+    (zlib releases the GIL) and written in order. Concatenated members are a valid .gz file.
+    """
+
+    def __init__(self, fileobj, threads=None, level=6):
+        self.fileobj = fileobj
+        self.level = level
+        self.threads = threads or os.cpu_count() or 1
+        self.pool = ThreadPoolExecutor(max_workers=self.threads)
+        self.pending = deque()
+        self.buffer = bytearray()
+
+    def _submit(self, block):
+        self.pending.append(self.pool.submit(gzip.compress, block, self.level))
+        # 메모리 사용을 (스레드 수 x 2) 블록으로 제한
+        while len(self.pending) > self.threads * 2:
+            self.fileobj.write(self.pending.popleft().result())
+
+    def write(self, data):
+        self.buffer += data
+        while len(self.buffer) >= BLOCK_SIZE:
+            self._submit(bytes(self.buffer[:BLOCK_SIZE]))
+            del self.buffer[:BLOCK_SIZE]
+
+    def close(self):
+        if self.buffer:
+            self._submit(bytes(self.buffer))
+            self.buffer = bytearray()
+        while self.pending:
+            self.fileobj.write(self.pending.popleft().result())
+        self.pool.shutdown()
+
+
+def open_compressor(fileobj, compression='gzip', threads=None):
+    if compression == 'gzip':
+        return ParallelGzipWriter(fileobj, threads=threads)
+    if compression == 'zstd':
+        import zstandard
+
+        cctx = zstandard.ZstdCompressor(level=3, threads=threads or -1)
+        return cctx.stream_writer(fileobj, closefd=False)
+    raise ValueError(f"Unknown compression: {compression} (gzip / zstd)")
+
+
+def open_decompressor(path, compression='gzip'):
+    if compression == 'gzip':
+        return gzip.open(path, 'rb')
+    if compression == 'zstd':
+        import zstandard
+
+        return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+    raise ValueError(f"Unknown compression: {compression} (gzip / zstd)")
+
+
+def stream_compressed(cmd, out_path, compression='gzip', threads=None):
+    """
+    Run `cmd` and pipe its stdout straight into the compressor; nothing is written uncompressed.
+    The output is written to `<out_path>.part` and renamed only when the command succeeds.
+    """
+    part_path = out_path + '.part'
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stderr_chunks = []
+    # stderr 파이프가 가득 차서 멈추지 않도록 별도 스레드에서 비운다
+    drain = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+    drain.start()
+    try:
+        with open(part_path, 'wb') as f_out:
+            writer = open_compressor(f_out, compression, threads)
+            while True:
+                block = proc.stdout.read(BLOCK_SIZE)
+                if not block:
+                    break
+                writer.write(block)
+            writer.close()
+        proc.wait()
+        drain.join()
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(
+                proc.returncode, cmd[0], stderr=b''.join(stderr_chunks).decode('utf-8', 'replace')
+            )
+        os.replace(part_path, out_path)
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+        if os.path.exists(part_path):
+            os.remove(part_path)
+    return out_path
+
+
+def backup_and_compress(host, user, schemas, output_dir='.', compression='gzip', threads=None):
     password = getpass.getpass("MySQL 비밀번호: ")
     timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
     schema_part = "_".join(schemas)
-    sql_file = os.path.join(output_dir, f"backup_{schema_part}_{timestamp}.sql")
-    gz_file = sql_file + ".gz"
+    out_file = os.path.join(output_dir, f"backup_{schema_part}_{timestamp}{EXTENSIONS[compression]}")
 
     cmd = [
         "mysqldump",
@@ -24,29 +139,431 @@ def backup_and_compress(host, user, schemas, output_dir='.'):
     ]
 
     try:
-        print(f"🔄 백업 중: {', '.join(schemas)}")
-        with open(sql_file, 'w', encoding='utf-8') as f:
-            subprocess.run(cmd, stdout=f, stderr=subprocess.PIPE, text=True, check=True)
-
-        print("📦 gzip 압축 중...")
-        with open(sql_file, 'rb') as f_in, gzip.open(gz_file, 'wb') as f_out:
-            shutil.copyfileobj(f_in, f_out)
-
-        os.remove(sql_file)  # 원본 SQL 파일 삭제
-        print(f"✅ 완료: {gz_file}")
+        print(f"🔄 백업 + {compression} 스트리밍 압축 중: {', '.join(schemas)}")
+        stream_compressed(cmd, out_file, compression, threads)
+        print(f"✅ 완료: {out_file}")
 
     except subprocess.CalledProcessError as e:
         print("❌ 백업 실패!")
         if e.stderr:
             print("오류 메시지:", e.stderr)
 
+# ───────────────────────────────────────────────
+# 병렬 백업 / 복원 (테이블 단위 파일 + manifest)
+# ───────────────────────────────────────────────
+
+def _client_cmd(binary, host, user, password, *args):
+    return [binary, f"--host={host}", f"--user={user}", f"--password={password}", *args]
+
+
+def _connect(host, user, password):
+    return pymysql.connect(host=host, user=user, password=password, charset='utf8mb4')
+
+
+def _list_tables(conn, schemas):
+    """
+    Base tables with their insertable (non-generated) columns, biggest first so workers stay balanced.
+    """
+    with conn.cursor() as cur:
+        try:
+            # MySQL 8 은 UPDATE_TIME 등 통계를 기본 하루 동안 캐시한다 → 증분 판단에 최신 값 사용
+            cur.execute("SET SESSION information_schema_stats_expiry = 0")
+        except pymysql.MySQLError:
+            pass  # 5.7 이하: 캐시 없음
+        cur.execute(
+            "SELECT t.TABLE_SCHEMA, t.TABLE_NAME, COALESCE(t.DATA_LENGTH, 0), t.UPDATE_TIME, c.COLUMN_NAME "
+            "FROM information_schema.TABLES t "
+            "JOIN information_schema.COLUMNS c "
+            "  ON c.TABLE_SCHEMA = t.TABLE_SCHEMA AND c.TABLE_NAME = t.TABLE_NAME "
+            "WHERE t.TABLE_SCHEMA IN %s AND t.TABLE_TYPE = 'BASE TABLE' "
+            # DEFAULT_GENERATED(식 기본값, 예: DEFAULT CURRENT_TIMESTAMP)는 값이 있는 일반 열이다
+            "  AND c.EXTRA NOT LIKE '%%VIRTUAL GENERATED%%' AND c.EXTRA NOT LIKE '%%STORED GENERATED%%' "
+            "ORDER BY t.TABLE_SCHEMA, t.TABLE_NAME, c.ORDINAL_POSITION",
+            (tuple(schemas),),
+        )
+        tables = {}
+        for schema, table, size, update_time, column in cur.fetchall():
+            entry = tables.setdefault((schema, table), {
+                'schema': schema,
+                'table': table,
+                'size': size,
+                'update_time': update_time.isoformat() if update_time else None,
+                'columns': [],
+            })
+            entry['columns'].append(column)
+    return sorted(tables.values(), key=lambda t: t['size'], reverse=True)
+
+
+def _dump_table(conn, entry, path, compression):
+    """
+    Write one table as extended INSERT statements into a compressed file; returns the row count
+    and a hash of the dumped rows (computed while streaming, so no extra table scan).
+    """
+    cols = ", ".join(f"`{c}`" for c in entry['columns'])
+    prefix = f"INSERT INTO `{entry['table']}` ({cols}) VALUES\n".encode('utf-8')
+    rows = 0
+    row_hash = hashlib.blake2b(digest_size=16)
+    part_path = path + '.part'
+    try:
+        with open(part_path, 'wb') as f_out:
+            writer = open_compressor(f_out, compression, threads=1)
+            with conn.cursor(pymysql.cursors.SSCursor) as cur:
+                cur.execute(f"SELECT {cols} FROM `{entry['schema']}`.`{entry['table']}`")
+                batch, batch_bytes = [], 0
+                for row in cur:
+                    literal = conn.escape(row).encode('utf-8')
+                    row_hash.update(literal + b"\n")
+                    batch.append(literal)
+                    batch_bytes += len(literal)
+                    rows += 1
+                    if batch_bytes >= INSERT_BYTES:
+                        writer.write(prefix + b",\n".join(batch) + b";\n")
+                        batch, batch_bytes = [], 0
+                if batch:
+                    writer.write(prefix + b",\n".join(batch) + b";\n")
+            writer.close()
+    except BaseException:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+    os.replace(part_path, path)
+    return rows, row_hash.hexdigest()
+
+
+def _same_update_time(entry, previous, base_snapshot):
+    """
+    True when InnoDB reports the same non-NULL UPDATE_TIME as the base backup and that time is
+    strictly before the base snapshot's second. UPDATE_TIME has one-second precision, so a
+    write committed in the snapshot's own second could leave it unchanged; that counts as changed.
+    """
+    if previous is None or previous['columns'] != entry['columns']:
+        return False
+    return (
+        entry['update_time'] is not None
+        and previous.get('update_time') == entry['update_time']
+        and base_snapshot is not None
+        and entry['update_time'] < base_snapshot
+    )
+
+
+def _dump_worker(conn, tasks, backup_dir, compression, results, errors, previous_tables=None,
+                 use_checksum=False, base_snapshot=None):
+    previous_tables = previous_tables or {}
+    while True:
+        try:
+            entry = tasks.get_nowait()
+        except queue.Empty:
+            return
+        name = f"{entry['schema']}.{entry['table']}"
+        file_name = name + EXTENSIONS[compression]
+        try:
+            started = datetime.datetime.now()
+            previous = previous_tables.get((entry['schema'], entry['table']))
+            record = {
+                'schema': entry['schema'],
+                'table': entry['table'],
+                'columns': entry['columns'],
+                'update_time': entry['update_time'],
+            }
+            if not use_checksum and _same_update_time(entry, previous, base_snapshot):
+                # 변경 없음 → 읽지 않고 이전 백업 파일을 그대로 참조
+                record.update(file=previous['file'], rows=previous['rows'], source=previous['source'],
+                              row_hash=previous.get('row_hash'))
+                results.append(record)
+                print(f"  ⏭️ {name}: unchanged (→ {previous['source']})")
+                continue
+            path = os.path.join(backup_dir, file_name)
+            rows, row_hash = _dump_table(conn, entry, path, compression)
+            record['row_hash'] = row_hash
+            if (use_checksum and previous is not None and previous['columns'] == entry['columns']
+                    and previous.get('row_hash') == row_hash):
+                # 덤프한 행이 이전 백업과 같음 → 새 파일은 버리고 이전 파일을 참조
+                os.remove(path)
+                record.update(file=previous['file'], rows=previous['rows'], source=previous['source'])
+                results.append(record)
+                print(f"  ⏭️ {name}: unchanged (→ {previous['source']})")
+                continue
+            seconds = (datetime.datetime.now() - started).total_seconds()
+            record.update(file=file_name, rows=rows, source=os.path.basename(backup_dir))
+            results.append(record)
+            print(f"  📄 {name}: {rows} rows ({seconds:.1f}s)")
+        except Exception as e:
+            errors.append((name, e))
+            print(f"  ❌ {name}: {e}")
+
+
+def _open_snapshot_connections(host, user, password, jobs, while_locked=None):
+    """
+    Open `jobs` connections that all see the same consistent snapshot (global read lock held only
+    while the transactions start), and return them with the binlog position at that moment.
+
+    `while_locked(conn)` runs before the lock is released, so anything it reads (DDL, column
+    lists) matches the snapshot: no DDL can run while the global read lock is held.
+    """
+    coordinator = _connect(host, user, password)
+    conns = []
+    binlog = None
+    try:
+        with coordinator.cursor() as cur:
+            cur.execute("FLUSH TABLES WITH READ LOCK")
+        for _ in range(jobs):
+            conn = _connect(host, user, password)
+            conns.append(conn)
+            with conn.cursor() as cur:
+                cur.execute("SET SESSION time_zone = '+00:00'")
+                cur.execute("SET SESSION TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+                cur.execute("START TRANSACTION WITH CONSISTENT SNAPSHOT")
+        with coordinator.cursor() as cur:
+            try:
+                cur.execute("SHOW MASTER STATUS")
+                status = cur.fetchone()
+                binlog = {'file': status[0], 'position': status[1]} if status else None
+            except pymysql.MySQLError:
+                binlog = None
+        if while_locked is not None:
+            while_locked(coordinator)
+    except BaseException:
+        for conn in conns:
+            conn.close()
+        raise
+    finally:
+        try:
+            with coordinator.cursor() as cur:
+                cur.execute("UNLOCK TABLES")
+        finally:
+            coordinator.close()
+    return conns, binlog
+
+
+def _load_manifest(backup_dir):
+    with open(os.path.join(backup_dir, MANIFEST), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def find_latest_backup(output_dir, schemas):
+    """
+    Most recent backup_parallel directory in `output_dir` for exactly these schemas.
+    """
+    prefix = f"backup_{'_'.join(schemas)}_"
+    candidates = sorted(
+        d for d in os.listdir(output_dir)
+        if d.startswith(prefix) and os.path.exists(os.path.join(output_dir, d, MANIFEST))
+    )
+    return os.path.join(output_dir, candidates[-1]) if candidates else None
+
+
+def backup_parallel(host, user, schemas, output_dir='.', jobs=4, compression='gzip', password=None,
+                    base=None, use_checksum=True):
+    """
+    Dump every table of `schemas` into its own compressed file from one consistent snapshot,
+    using `jobs` worker connections, plus per-schema DDL / trigger files and a manifest.json.
+
+    With `base` (an earlier backup directory in the same `output_dir`) the backup is incremental:
+    tables whose rows hash the same as in the base manifest keep pointing at the base's file.
+    The hash is taken while each table is streamed, so every table is still read once; with
+    use_checksum=False tables with the same UPDATE_TIME are not read at all (only tables last
+    written before the base snapshot's second qualify, since UPDATE_TIME has 1 s precision).
+    """
+    password = password if password is not None else getpass.getpass("MySQL 비밀번호: ")
+    timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+    backup_dir = os.path.join(output_dir, f"backup_{'_'.join(schemas)}_{timestamp}")
+    ext = EXTENSIONS[compression]
+
+    previous_tables = {}
+    base_snapshot = None
+    if base is not None:
+        if os.path.abspath(os.path.dirname(base)) != os.path.abspath(output_dir):
+            raise ValueError("Incremental base must live in the same output_dir")
+        base_manifest = _load_manifest(base)
+        if base_manifest['compression'] != compression:
+            raise ValueError(f"Base backup uses {base_manifest['compression']}, not {compression}")
+        previous_tables = {(t['schema'], t['table']): t for t in base_manifest['tables']}
+        base_snapshot = base_manifest.get('snapshot_time')
+    os.makedirs(backup_dir, exist_ok=True)
+
+    kind = 'incremental' if base is not None else 'full'
+    print(f"🔄 병렬 {kind} 백업 ({jobs} workers): {', '.join(schemas)}")
+    manifest = {
+        'created': timestamp,
+        'host': host,
+        'type': kind,
+        'base': os.path.basename(base) if base is not None else None,
+        'compression': compression,
+        'schemas': {},
+        'tables': [],
+    }
+    tables = []
+
+    def dump_ddl(conn):
+        # DDL (테이블, 뷰, 루틴) 과 트리거는 데이터 적재 전/후에 따로 복원할 수 있도록 분리.
+        # 전역 읽기 잠금 안에서 받으므로 DDL·컬럼 목록·데이터가 같은 시점이다
+        for schema in schemas:
+            schema_file = f"{schema}-schema{ext}"
+            trigger_file = f"{schema}-triggers{ext}"
+            stream_compressed(
+                _client_cmd("mysqldump", host, user, password, "--databases", schema,
+                            "--no-data", "--routines", "--skip-triggers", "--no-tablespaces"),
+                os.path.join(backup_dir, schema_file), compression,
+            )
+            stream_compressed(
+                _client_cmd("mysqldump", host, user, password, schema,
+                            "--no-data", "--no-create-info", "--no-create-db", "--triggers",
+                            "--skip-routines", "--no-tablespaces"),
+                os.path.join(backup_dir, trigger_file), compression,
+            )
+            manifest['schemas'][schema] = {'schema_file': schema_file, 'trigger_file': trigger_file}
+        tables.extend(_list_tables(conn, schemas))
+        # UPDATE_TIME 과 같은 세션·시간대의 서버 시각 (다음 증분 백업의 기준)
+        with conn.cursor() as cur:
+            cur.execute("SELECT NOW()")
+            manifest['snapshot_time'] = cur.fetchone()[0].isoformat()
+
+    conns, binlog = _open_snapshot_connections(host, user, password, jobs, while_locked=dump_ddl)
+    manifest['binlog'] = binlog
+    tasks = queue.Queue()
+    for entry in tables:
+        tasks.put(entry)
+
+    results, errors = [], []
+    threads = [
+        threading.Thread(
+            target=_dump_worker,
+            args=(conn, tasks, backup_dir, compression, results, errors, previous_tables, use_checksum,
+                  base_snapshot),
+        )
+        for conn in conns
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for conn in conns:
+        conn.close()
+
+    if errors:
+        print(f"❌ 백업 실패: {len(errors)} 테이블")
+        raise RuntimeError(f"Parallel backup failed for: {', '.join(name for name, _ in errors)}")
+
+    manifest['tables'] = sorted(results, key=lambda r: (r['schema'], r['table']))
+    with open(os.path.join(backup_dir, MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    dumped = sum(1 for r in results if r['source'] == os.path.basename(backup_dir))
+    print(f"✅ 완료: {backup_dir} ({dumped} dumped, {len(results) - dumped} reused)")
+    return backup_dir
+
+
+def _pipe_to_mysql(cmd, path, compression, header=b'', footer=b''):
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+    stderr_chunks = []
+    drain = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+    drain.start()
+    try:
+        proc.stdin.write(header)
+        with open_decompressor(path, compression) as f_in:
+            while True:
+                block = f_in.read(BLOCK_SIZE)
+                if not block:
+                    break
+                proc.stdin.write(block)
+        proc.stdin.write(footer)
+    except BrokenPipeError:
+        pass  # mysql 이 먼저 종료됨 → 아래 returncode 로 보고
+    finally:
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        proc.wait()
+        drain.join()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(
+            proc.returncode, cmd[0], stderr=b''.join(stderr_chunks).decode('utf-8', 'replace')
+        )
+
+
+def _check_restored_columns(host, user, password, schemas, entries):
+    """
+    Fail before loading data when a restored table's columns differ from the ones its INSERT
+    file was written with.
+    """
+    conn = _connect(host, user, password)
+    try:
+        restored = {(t['schema'], t['table']): t['columns'] for t in _list_tables(conn, schemas)}
+    finally:
+        conn.close()
+    mismatched = [
+        f"{e['schema']}.{e['table']}" for e in entries
+        if restored.get((e['schema'], e['table'])) != e['columns']
+    ]
+    if mismatched:
+        raise RuntimeError(f"Restored DDL does not match the dumped columns of: {', '.join(mismatched)}")
+
+
+def restore_parallel(backup_dir, host, user, jobs=4, password=None, schemas=None):
+    """
+    Restore a `backup_parallel` directory: schema DDL first, then all table files in parallel
+    with bulk-load session settings, then triggers.
+    """
+    password = password if password is not None else getpass.getpass("MySQL 비밀번호: ")
+    manifest = _load_manifest(backup_dir)
+    compression = manifest['compression']
+    schemas = schemas or list(manifest['schemas'])
+    mysql = lambda *args: _client_cmd("mysql", host, user, password, *args)
+
+    # 증분 백업의 테이블 파일은 이전 백업 디렉터리(source)에 있을 수 있다
+    root = os.path.dirname(os.path.abspath(backup_dir))
+    table_path = lambda entry: os.path.join(root, entry.get('source', os.path.basename(backup_dir)), entry['file'])
+    entries = [t for t in manifest['tables'] if t['schema'] in schemas]
+    missing = [table_path(t) for t in entries if not os.path.exists(table_path(t))]
+    if missing:
+        raise FileNotFoundError(f"Backup chain is incomplete, missing: {', '.join(missing)}")
+
+    print(f"🔄 복원 ({jobs} workers): {', '.join(schemas)}")
+    for schema in schemas:
+        _pipe_to_mysql(mysql(), os.path.join(backup_dir, manifest['schemas'][schema]['schema_file']), compression)
+        print(f"  🧱 schema: {schema}")
+    _check_restored_columns(host, user, password, schemas, entries)
+
+    def load(entry):
+        started = datetime.datetime.now()
+        _pipe_to_mysql(
+            mysql(f"--database={entry['schema']}"),
+            table_path(entry),
+            compression,
+            header=BULK_LOAD_HEADER,
+            footer=BULK_LOAD_FOOTER,
+        )
+        seconds = (datetime.datetime.now() - started).total_seconds()
+        print(f"  📥 {entry['schema']}.{entry['table']}: {entry['rows']} rows ({seconds:.1f}s)")
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        list(pool.map(load, entries))
+
+    for schema in schemas:
+        _pipe_to_mysql(
+            mysql(f"--database={schema}"),
+            os.path.join(backup_dir, manifest['schemas'][schema]['trigger_file']),
+            compression,
+        )
+    print(f"✅ 복원 완료: {backup_dir}")
+
+
 def main():
     host = "localhost"
     user = "root"
     schemas = ["bank", "wpp"]  # 원하는 스키마 리스트
     output_dir = r'C:\Users\parkj\Documents\workspace\my_projects\data\sql_data'  # 저장 위치
 
-    backup_and_compress(host, user, schemas, output_dir)
+    mode = sys.argv[1] if len(sys.argv) > 1 else "dump"
+    if mode == "parallel":
+        backup_parallel(host, user, schemas, output_dir, jobs=os.cpu_count() or 4)
+    elif mode == "incremental":
+        base = sys.argv[2] if len(sys.argv) > 2 else find_latest_backup(output_dir, schemas)
+        backup_parallel(host, user, schemas, output_dir, jobs=os.cpu_count() or 4, base=base)
+    elif mode == "restore":
+        restore_parallel(sys.argv[2], host, user, jobs=os.cpu_count() or 4)
+    else:
+        backup_and_compress(host, user, schemas, output_dir)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,156 @@
+-- region_dependency_summary 의 materialized 버전 (모든 연도, PK = iso3 + year)
+-- simple / region 변경은 trigger 가 region_dependency_dirty 에 (iso3, year) 로 기록하고,
+-- refresh_region_dependency_summary() 가 그 그룹만 다시 집계한다.
+
+CREATE TABLE IF NOT EXISTS region_dependency_summary_mat (
+    iso3 CHAR(3) NOT NULL,
+    year CHAR(4) NOT NULL,
+    region VARCHAR(50) NOT NULL,
+    subregion VARCHAR(50) NOT NULL,
+    country VARCHAR(50) NOT NULL,
+    total_population DECIMAL(20, 2),
+    weighted_avg_age DECIMAL(10, 2),
+    total_dependency_ratio DECIMAL(10, 2),
+    youth_dependency_ratio DECIMAL(10, 2),
+    elderly_dependency_ratio DECIMAL(10, 2),
+    five_year_avg_birth_rate INT UNSIGNED,
+    CONSTRAINT pk_region_dependency_summary_mat PRIMARY KEY (iso3, year),
+    INDEX idx_rdsm_year_country (year, country)
+);
+
+CREATE TABLE IF NOT EXISTS region_dependency_dirty (
+    iso3 CHAR(3) NOT NULL,
+    year CHAR(4) NOT NULL,
+    PRIMARY KEY (iso3, year)
+);
+
+DROP TRIGGER IF EXISTS trg_simple_dirty_insert;
+DROP TRIGGER IF EXISTS trg_simple_dirty_update;
+DROP TRIGGER IF EXISTS trg_simple_dirty_delete;
+DROP TRIGGER IF EXISTS trg_region_dirty_update;
+DROP PROCEDURE IF EXISTS refresh_region_dependency_summary;
+DROP PROCEDURE IF EXISTS refresh_region_dependency_summary_full;
+
+DELIMITER //
+
+CREATE TRIGGER trg_simple_dirty_insert AFTER INSERT ON simple
+FOR EACH ROW
+BEGIN
+    INSERT IGNORE INTO region_dependency_dirty (iso3, year) VALUES (NEW.iso3, NEW.year);
+END //
+
+CREATE TRIGGER trg_simple_dirty_update AFTER UPDATE ON simple
+FOR EACH ROW
+BEGIN
+    INSERT IGNORE INTO region_dependency_dirty (iso3, year) VALUES (OLD.iso3, OLD.year), (NEW.iso3, NEW.year);
+END //
+
+CREATE TRIGGER trg_simple_dirty_delete AFTER DELETE ON simple
+FOR EACH ROW
+BEGIN
+    INSERT IGNORE INTO region_dependency_dirty (iso3, year) VALUES (OLD.iso3, OLD.year);
+END //
+
+-- country / region / subregion 이름이 바뀌면 해당 iso3 의 모든 연도를 다시 계산
+CREATE TRIGGER trg_region_dirty_update AFTER UPDATE ON region
+FOR EACH ROW
+BEGIN
+    INSERT IGNORE INTO region_dependency_dirty (iso3, year)
+    SELECT DISTINCT s.iso3, s.year FROM simple s WHERE s.iso3 IN (OLD.iso3, NEW.iso3);
+END //
+
+-- 변경된 (iso3, year) 그룹만 다시 집계
+CREATE PROCEDURE refresh_region_dependency_summary()
+BEGIN
+    DROP TEMPORARY TABLE IF EXISTS _rds_refresh_keys;
+    CREATE TEMPORARY TABLE _rds_refresh_keys (
+        iso3 CHAR(3) NOT NULL,
+        year CHAR(4) NOT NULL,
+        PRIMARY KEY (iso3, year)
+    );
+
+    START TRANSACTION;
+
+    INSERT INTO _rds_refresh_keys (iso3, year)
+    SELECT iso3, year FROM region_dependency_dirty FOR UPDATE;
+
+    DELETE d FROM region_dependency_dirty d
+    JOIN _rds_refresh_keys k ON d.iso3 = k.iso3 AND d.year = k.year;
+
+    DELETE m FROM region_dependency_summary_mat m
+    JOIN _rds_refresh_keys k ON m.iso3 = k.iso3 AND m.year = k.year;
+
+    INSERT INTO region_dependency_summary_mat (
+        iso3, year, region, subregion, country,
+        total_population, weighted_avg_age,
+        total_dependency_ratio, youth_dependency_ratio, elderly_dependency_ratio,
+        five_year_avg_birth_rate
+    )
+    SELECT
+        r.iso3,
+        s.year,
+        r.region,
+        r.subregion,
+        r.country,
+        ROUND(SUM(s.population), 2),
+        ROUND(SUM(s.age * s.population) / SUM(s.population), 2),
+        ROUND((
+          SUM(CASE WHEN s.age <= 15 THEN s.population ELSE 0 END) +
+          SUM(CASE WHEN s.age >= 65 THEN s.population ELSE 0 END)
+        ) / NULLIF(SUM(CASE WHEN s.age > 15 AND s.age < 65 THEN s.population ELSE 0 END), 0) * 100, 2),
+        ROUND(SUM(CASE WHEN s.age <= 15 THEN s.population ELSE 0 END) / NULLIF(SUM(CASE WHEN s.age > 15 AND s.age < 65 THEN s.population ELSE 0 END), 0) * 100, 2),
+        ROUND(SUM(CASE WHEN s.age >= 65 THEN s.population ELSE 0 END) / NULLIF(SUM(CASE WHEN s.age > 15 AND s.age < 65 THEN s.population ELSE 0 END), 0) * 100, 2),
+        CAST(FLOOR((SUM(CASE WHEN s.age BETWEEN 0 AND 4 THEN s.population ELSE 0 END) / SUM(s.population)) / 5 * 1000) AS UNSIGNED)
+    FROM
+        _rds_refresh_keys k
+    INNER JOIN
+        simple s ON s.iso3 = k.iso3 AND s.year = k.year
+    INNER JOIN
+        region r ON r.iso3 = s.iso3
+    GROUP BY
+        r.iso3, s.year;
+
+    COMMIT;
+
+    DROP TEMPORARY TABLE IF EXISTS _rds_refresh_keys;
+END //
+
+-- 모든 (iso3, year) 를 dirty 로 표시한 뒤 같은 경로로 전체 재계산
+CREATE PROCEDURE refresh_region_dependency_summary_full()
+BEGIN
+    INSERT IGNORE INTO region_dependency_dirty (iso3, year)
+    SELECT DISTINCT iso3, year FROM simple;
+
+    DELETE m FROM region_dependency_summary_mat m
+    LEFT JOIN region_dependency_dirty d ON m.iso3 = d.iso3 AND m.year = d.year
+    WHERE d.iso3 IS NULL;
+
+    CALL refresh_region_dependency_summary();
+END //
+
+DELIMITER ;
+
+-- region_dependency_summary / core 와 같은 결과를 PK 조회로 제공
+CREATE OR REPLACE VIEW region_dependency_summary_fast AS
+SELECT
+    iso3, region, subregion, country,
+    total_population, weighted_avg_age,
+    total_dependency_ratio, youth_dependency_ratio, elderly_dependency_ratio,
+    five_year_avg_birth_rate
+FROM region_dependency_summary_mat
+WHERE year = '2023';
+
+CREATE OR REPLACE VIEW core_fast AS
+SELECT *
+FROM region_dependency_summary_fast
+WHERE country IN (
+    'China',
+    'Republic of Korea',
+    "Dem. People's Republic of Korea",
+    'Japan',
+    'United States of America',
+    'France',
+    'Germany',
+    'United Kingdom',
+    'Russian Federation'
+);
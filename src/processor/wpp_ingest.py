@@ -0,0 +1,371 @@
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pcsv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
+
+from data import PostgreSQLDB
+from wpp_metrics import REGION_COLUMNS, SIMPLE_COLUMNS
+
+# WPP2024.csv 원본 컬럼
+NAME_COL = "Region, subregion, country or area *"
+TYPE_COL = "Type"
+ISO3_COL = "ISO3 Alpha-code"
+YEAR_COL = "Year"
+ID_COLUMNS = [NAME_COL, TYPE_COL, ISO3_COL, YEAR_COL]
+
+# 지역 계층은 이 Type 들만 파일 순서대로 보고 ffill 한다 (World, SDG region 등은 건너뜀)
+HIERARCHY_TYPES = ("Region", "Subregion", "Country/Area")
+HIERARCHY_YEAR = 2023
+CHUNK_ROWS = 20_000  # CSV 행 기준; 한 청크는 나이 컬럼 수(101)배의 simple 행이 된다
+
+SIMPLE_SCHEMA = pa.schema([
+    ("iso3", pa.string()),
+    ("year", pa.string()),  # MySQL 과 같이 CHAR(4)
+    ("age", pa.int16()),
+    ("population", pa.int32()),
+])
+REGION_SCHEMA = pa.schema([(c, pa.string()) for c in REGION_COLUMNS])
+
+TABLE_DDL = [
+    "DROP TABLE IF EXISTS simple",
+    "DROP TABLE IF EXISTS region",
+    """
+    CREATE TABLE region (
+        iso3 CHAR(3) UNIQUE,
+        country VARCHAR(50) NOT NULL,
+        region VARCHAR(50) NOT NULL,
+        subregion VARCHAR(50) NOT NULL,
+        PRIMARY KEY (iso3)
+    )
+    """,
+    """
+    CREATE TABLE simple (
+        iso3 CHAR(3) NOT NULL,
+        year CHAR(4) NOT NULL,
+        age INT NOT NULL,
+        population INT,
+        CONSTRAINT pk_simple PRIMARY KEY (iso3, year, age),
+        CONSTRAINT fk_region FOREIGN KEY (iso3) REFERENCES region(iso3)
+    )
+    """,
+]
+
+
+# ───────────────────────────────────────────────
+# CSV -> Parquet (청크 단위 스트리밍)
+# ───────────────────────────────────────────────
+
+def age_columns(csv_path):
+    """
+    The single-age population columns ("0" ... "99", "100+") in file order.
+    """
+    header = pd.read_csv(csv_path, nrows=0).columns
+    return [c for c in header if c.isdigit() or (c.endswith("+") and c[:-1].isdigit())]
+
+
+def iter_wpp_chunks(csv_path, chunksize=CHUNK_ROWS):
+    """
+    Yield CSV chunks holding only the id and age columns.
+    """
+    ages = age_columns(csv_path)
+    reader = pd.read_csv(
+        csv_path,
+        usecols=ID_COLUMNS + ages,
+        dtype={NAME_COL: str, TYPE_COL: str, ISO3_COL: str},
+        chunksize=chunksize,
+    )
+    with reader:
+        for chunk in reader:
+            yield chunk
+
+
+class RegionHierarchy:
+    """
+    Region/subregion for every country, derived from the Region/Subregion header rows that
+    precede the countries in file order. The last region and subregion seen are carried
+    over, so feeding chunks one by one gives the same result as a ffill over the whole file.
+    """
+    def __init__(self, year=HIERARCHY_YEAR):
+        self.year = year
+        self.region = None
+        self.subregion = None
+        self.parts = []
+
+    def _fill(self, values, carry):
+        values = values.ffill()
+        if carry is not None:
+            values = values.fillna(carry)
+        last = values.iloc[-1]
+        return values, (carry if pd.isna(last) else last)
+
+    def feed(self, chunk):
+        rows = chunk[(chunk[YEAR_COL] == self.year) & chunk[TYPE_COL].isin(HIERARCHY_TYPES)]
+        if rows.empty:
+            return
+        name, kind = rows[NAME_COL], rows[TYPE_COL]
+        region, self.region = self._fill(name.where(kind == "Region"), self.region)
+        subregion, self.subregion = self._fill(name.where(kind == "Subregion"), self.subregion)
+        # Northern America 는 하위 subregion 이 없는 region 이라 자기 자신을 subregion 으로 쓴다
+        subregion = subregion.mask(region == "Northern America", "Northern America")
+        countries = kind == "Country/Area"
+        self.parts.append(pd.DataFrame({
+            "iso3": rows.loc[countries, ISO3_COL],
+            "country": name[countries],
+            "region": region[countries],
+            "subregion": subregion[countries],
+        }))
+
+    def frame(self):
+        if not self.parts:
+            return pd.DataFrame(columns=REGION_COLUMNS)
+        return pd.concat(self.parts, ignore_index=True)[REGION_COLUMNS]
+
+
+def melt_chunk(chunk, ages):
+    """
+    Country rows of one chunk in long form (iso3, year, age, population) as an Arrow table.
+
+    Same result as `melt` + to_numeric(errors='coerce') * 1000 + round + Int64, but the age
+    block is reshaped as one float array instead of copying a melted frame per step.
+    """
+    rows = chunk[chunk[TYPE_COL] == "Country/Area"]
+    n_rows, n_ages = len(rows), len(ages)
+    pops = np.empty((n_rows, n_ages), dtype=np.float64)
+    for i, col in enumerate(ages):
+        pops[:, i] = pd.to_numeric(rows[col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    pops = np.rint(pops * 1000).ravel()
+    missing = np.isnan(pops)
+    age_values = np.array([int(c.rstrip("+")) for c in ages], dtype=np.int16)
+    return pa.Table.from_arrays(
+        [
+            pa.array(np.repeat(rows[ISO3_COL].to_numpy(dtype=object), n_ages), type=pa.string()),
+            pa.array(np.repeat(rows[YEAR_COL].astype("int64").astype(str).to_numpy(dtype=object), n_ages), type=pa.string()),
+            pa.array(np.tile(age_values, n_rows)),
+            pa.array(np.where(missing, 0, pops).astype(np.int32), mask=missing),
+        ],
+        schema=SIMPLE_SCHEMA,
+    )
+
+
+def ingest_csv(csv_path, out_dir, chunksize=CHUNK_ROWS, hierarchy_year=HIERARCHY_YEAR):
+    """
+    Stream WPP2024.csv into `out_dir`/simple.parquet and `out_dir`/region.parquet.
+    Peak memory is bounded by `chunksize`; files are written to *.part and renamed at the end.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    simple_path = os.path.join(out_dir, "simple.parquet")
+    region_path = os.path.join(out_dir, "region.parquet")
+    ages = age_columns(csv_path)
+    hierarchy = RegionHierarchy(hierarchy_year)
+    started = time.perf_counter()
+    n_rows = 0
+    with pq.ParquetWriter(simple_path + ".part", SIMPLE_SCHEMA) as writer:
+        for i, chunk in enumerate(iter_wpp_chunks(csv_path, chunksize), 1):
+            hierarchy.feed(chunk)
+            table = melt_chunk(chunk, ages)
+            writer.write_table(table)
+            n_rows += table.num_rows
+            print(f"🔄 chunk {i}: {len(chunk):,} csv rows -> {table.num_rows:,} simple rows")
+
+    region = hierarchy.frame()
+    if region["iso3"].isnull().any() or not region["iso3"].is_unique:
+        print(f"⚠️ region iso3: {region['iso3'].isnull().sum()} null, unique={region['iso3'].is_unique}")
+    pq.write_table(pa.Table.from_pandas(region, schema=REGION_SCHEMA, preserve_index=False), region_path + ".part")
+    os.replace(simple_path + ".part", simple_path)
+    os.replace(region_path + ".part", region_path)
+    print(f"✅ Parquet: {n_rows:,} simple rows, {len(region)} regions ({time.perf_counter() - started:.1f}s)")
+    return simple_path, region_path
+
+
+# ───────────────────────────────────────────────
+# Parquet -> MySQL (연도 구간별 병렬 적재)
+# ───────────────────────────────────────────────
+
+# my_sql_backup 의 복원과 같은 대량 적재 세션 설정 (범위마다 한 트랜잭션)
+BULK_SESSION = (
+    "SET SESSION unique_checks = 0",
+    "SET SESSION foreign_key_checks = 0",
+)
+
+# pyarrow CSV: 문자열은 "..." ("" 로 이스케이프), NULL 은 빈 칸 → NULLIF 로 복원
+LOAD_SIMPLE_SQL = (
+    "LOAD DATA LOCAL INFILE %s INTO TABLE simple CHARACTER SET utf8mb4 "
+    "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+    "LINES TERMINATED BY '\\n' "
+    "(iso3, year, age, @population) SET population = NULLIF(@population, '')"
+)
+
+
+def _insert_sql(table, columns):
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+
+
+def _rows(batch, columns):
+    return list(zip(*(batch.column(c).to_pylist() for c in columns)))
+
+
+def parquet_years(simple_path):
+    years = set()
+    for batch in ds.dataset(simple_path).to_batches(columns=["year"]):
+        years.update(pc.unique(batch.column("year")).to_pylist())
+    return sorted(years)
+
+
+def year_ranges(years, jobs):
+    """
+    Split the sorted years into at most `jobs` contiguous ranges.
+    """
+    return [list(part) for part in np.array_split(np.array(years, dtype=object), min(jobs, len(years))) if len(part)]
+
+
+def create_tables(db):
+    with db.engine.begin() as conn:
+        for stmt in TABLE_DDL:
+            conn.exec_driver_sql(stmt)
+    print("✅ Created: region, simple")
+
+
+def load_region(db, region_path):
+    table = pq.read_table(region_path, columns=REGION_COLUMNS)
+    with db.engine.begin() as conn:
+        conn.exec_driver_sql(_insert_sql("region", REGION_COLUMNS), _rows(table, REGION_COLUMNS))
+    print(f"✅ region: {table.num_rows} rows")
+    return table.column("iso3").to_pylist()
+
+
+def bulk_engine(db):
+    """
+    Engine on the same database as `db` whose connections may send LOAD DATA LOCAL INFILE
+    (unpooled, so the bulk session settings never leak into other work).
+    """
+    return create_engine(db.engine.url, connect_args={"local_infile": True}, poolclass=NullPool)
+
+
+def _write_csv(dataset, expr, path, batch_rows):
+    """
+    Write the filtered rows of `dataset` as a headerless CSV (pyarrow's C++ writer); returns the row count.
+    """
+    schema = pa.schema([dataset.schema.field(c) for c in SIMPLE_COLUMNS])
+    n_rows = 0
+    with pcsv.CSVWriter(path, schema, write_options=pcsv.WriteOptions(include_header=False)) as writer:
+        for batch in dataset.to_batches(columns=SIMPLE_COLUMNS, filter=expr, batch_size=batch_rows):
+            writer.write_batch(batch)
+            n_rows += batch.num_rows
+    return n_rows
+
+
+def _load_years(engine, simple_path, years, iso3s, batch_rows, infile=True):
+    """
+    Load one year range in a single bulk transaction. Rows whose iso3 is not in region are
+    skipped (the notebook's JOIN on region).
+
+    With `infile` the range is written to a temporary CSV and sent with LOAD DATA LOCAL INFILE,
+    so Arrow and the server do the work and the ranges really run in parallel; otherwise it
+    falls back to batched INSERTs (values escaped in Python, serialized by the GIL).
+    """
+    started = time.perf_counter()
+    dataset = ds.dataset(simple_path)
+    expr = ds.field("year").isin(years) & ds.field("iso3").isin(iso3s)
+    with engine.begin() as conn:
+        for stmt in BULK_SESSION:
+            conn.exec_driver_sql(stmt)
+        if infile:
+            fd, csv_path = tempfile.mkstemp(prefix=f"simple_{years[0]}_", suffix=".csv")
+            os.close(fd)
+            try:
+                n_rows = _write_csv(dataset, expr, csv_path, batch_rows)
+                conn.exec_driver_sql(LOAD_SIMPLE_SQL, (csv_path,))
+            finally:
+                os.remove(csv_path)
+        else:
+            sql = _insert_sql("simple", SIMPLE_COLUMNS)
+            n_rows = 0
+            for batch in dataset.to_batches(columns=SIMPLE_COLUMNS, filter=expr, batch_size=batch_rows):
+                if batch.num_rows:
+                    conn.exec_driver_sql(sql, _rows(batch, SIMPLE_COLUMNS))
+                    n_rows += batch.num_rows
+    print(f"✅ simple {years[0]}-{years[-1]}: {n_rows:,} rows ({time.perf_counter() - started:.1f}s)")
+    return n_rows
+
+
+def local_infile_enabled(db):
+    with db.engine.connect() as conn:
+        return bool(conn.exec_driver_sql("SELECT @@GLOBAL.local_infile").scalar())
+
+
+def load_parquet(db, out_dir, jobs=4, create=True, batch_rows=50_000):
+    """
+    Load region, then simple split into `jobs` year ranges loaded concurrently, each with
+    LOAD DATA LOCAL INFILE (INSERT fallback when the server has local_infile=OFF).
+
+    With `create=True` both tables are dropped and re-created first (loading into tables
+    without triggers); if the materialized dependency summary is installed, it is
+    re-installed afterwards so its triggers exist again and its rows are rebuilt.
+    """
+    simple_path = os.path.join(out_dir, "simple.parquet")
+    region_path = os.path.join(out_dir, "region.parquet")
+    if create:
+        create_tables(db)
+    iso3s = load_region(db, region_path)
+    ranges = year_ranges(parquet_years(simple_path), jobs)
+    infile = local_infile_enabled(db)
+    if not infile:
+        print("⚠️ 서버 local_infile=OFF → INSERT 로 적재 (SET GLOBAL local_infile = 1 이면 LOAD DATA 사용)")
+    engine = bulk_engine(db)
+    try:
+        with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            futures = [
+                pool.submit(_load_years, engine, simple_path, years, iso3s, batch_rows, infile)
+                for years in ranges
+            ]
+            total = sum(f.result() for f in futures)
+    finally:
+        engine.dispose()
+    print(f"✅ simple: {total:,} rows in {len(ranges)} year ranges")
+
+    if create:
+        with db.engine.connect() as conn:
+            installed = conn.exec_driver_sql(
+                "SELECT COUNT(*) FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = 'region_dependency_summary_mat'"
+            ).scalar()
+        if installed:
+            from wpp_summary import install_materialized_summary
+            install_materialized_summary(db)
+    return total
+
+
+def _option(name, default):
+    if name in sys.argv:
+        return sys.argv[sys.argv.index(name) + 1]
+    return default
+
+
+def main():
+    csv_path = r"C:\Users\parkj\Documents\workspace\my_projects\data\heavy\WPP2024.csv"
+    out_dir = r"C:\Users\parkj\Documents\workspace\my_projects\data\wpp_parquet"
+
+    valued = {"--out", "--chunk", "--jobs"}
+    args = [a for i, a in enumerate(sys.argv[1:], 1) if not a.startswith("--") and sys.argv[i - 1] not in valued]
+    csv_path = args[0] if args else csv_path
+    out_dir = _option("--out", out_dir)
+    if "--load-only" not in sys.argv:
+        ingest_csv(csv_path, out_dir, chunksize=int(_option("--chunk", CHUNK_ROWS)))
+    if "--no-load" not in sys.argv:
+        db = PostgreSQLDB(database="wpp")
+        load_parquet(db, out_dir, jobs=int(_option("--jobs", 4)))
+
+
+if __name__ == "__main__":
+    main()
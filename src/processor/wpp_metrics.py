@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# MySQL 의 DECIMAL 나눗셈은 결과를 소수점 4자리(div_precision_increment)에서 반올림한다.
+# 뷰와 같은 값을 내기 위해 정수 합계로 같은 순서의 반올림을 재현한다.
+DIV_SCALE = 10_000
+
+REGION_COLUMNS = ["iso3", "region", "subregion", "country"]
+SIMPLE_COLUMNS = ["iso3", "year", "age", "population"]
+
+
+def _mysql_div(num, den):
+    """
+    num / den rounded half-up to 4 decimals, returned as an integer scaled by 10^4 (NaN where den == 0).
+    """
+    num = np.asarray(num, dtype=np.int64)
+    den = np.asarray(den, dtype=np.int64)
+    safe = np.where(den == 0, 1, den)
+    scaled = (2 * num * DIV_SCALE + safe) // (2 * safe)
+    return np.where(den == 0, np.nan, scaled)
+
+
+def _round_half_up(scaled, digits_dropped):
+    step = 10**digits_dropped
+    return np.floor((scaled + step // 2) / step)
+
+
+def read_wpp_parquet(path, columns, years=None):
+    """
+    Read only `columns` from a WPP Parquet file/dataset, pushing the year filter down.
+    """
+    filters = None
+    if years is not None:
+        years = list(years)
+        # year 는 MySQL 처럼 CHAR(4) 문자열로 저장되어 있을 수 있다
+        year_type = pq.ParquetDataset(path).schema.field("year").type
+        if pa.types.is_string(year_type) or pa.types.is_large_string(year_type):
+            years = [str(y) for y in years]
+        filters = [("year", "in", years)]
+    return pq.read_table(path, columns=columns, filters=filters).to_pandas()
+
+
+def dependency_metrics(simple, region, youth_max_age=15, elderly_min_age=65, birth_max_age=4):
+    """
+    Compute region_dependency_summary for every (iso3, year) in `simple`.
+
+    youth: age <= youth_max_age, elderly: age >= elderly_min_age,
+    working: youth_max_age < age < elderly_min_age, births proxy: 0 <= age <= birth_max_age.
+    With the default thresholds the values equal the SQL view row for row.
+    """
+    simple = simple[SIMPLE_COLUMNS]
+    age = simple["age"].to_numpy(dtype=np.int64)
+    pop = simple["population"].to_numpy(dtype="float64", na_value=np.nan)
+    valid = ~np.isnan(pop)
+    pop = np.where(valid, pop, 0).astype(np.int64)
+
+    parts = pd.DataFrame(
+        {
+            "iso3": simple["iso3"].to_numpy(),
+            "year": simple["year"].to_numpy(),
+            "pop": pop,
+            "age_pop": age * pop,
+            "youth": np.where(age <= youth_max_age, pop, 0),
+            "elderly": np.where(age >= elderly_min_age, pop, 0),
+            "working": np.where((age > youth_max_age) & (age < elderly_min_age), pop, 0),
+            "birth": np.where((age >= 0) & (age <= birth_max_age), pop, 0),
+            "valid": valid,
+        }
+    )
+    sums = parts.groupby(["iso3", "year"], sort=True, observed=True).sum()
+
+    # 인구가 전부 NULL 인 그룹도 뷰처럼 행은 남기고 지표만 NULL (분모 0 → NaN)
+    total = sums["pop"].to_numpy()
+    has_population = sums["valid"].to_numpy() > 0
+    working = sums["working"].to_numpy()
+    avg_age = _mysql_div(sums["age_pop"].to_numpy(), total)
+    birth_share = _mysql_div(sums["birth"].to_numpy(), total)
+
+    out = pd.DataFrame(
+        {
+            "total_population": np.where(has_population, total, np.nan),
+            "weighted_avg_age": _round_half_up(avg_age, 2) / 100,
+            # (a / b) * 100 을 소수 2자리로 반올림 = 4자리 나눗셈 결과를 그대로 100 배
+            "total_dependency_ratio": _mysql_div(sums["youth"].to_numpy() + sums["elderly"].to_numpy(), working) / 100,
+            "youth_dependency_ratio": _mysql_div(sums["youth"].to_numpy(), working) / 100,
+            "elderly_dependency_ratio": _mysql_div(sums["elderly"].to_numpy(), working) / 100,
+            # FLOOR(share / 5 * 1000) 에서 share 는 10^4 배 정수 → // 50
+            "five_year_avg_birth_rate": pd.array(np.floor(birth_share / 50), dtype="Int64"),
+        },
+        index=sums.index,
+    ).reset_index()
+
+    region = region[REGION_COLUMNS].drop_duplicates("iso3")
+    out = region.merge(out, on="iso3", how="inner")
+    columns = ["iso3", "year", "region", "subregion", "country"] + [
+        c for c in out.columns if c not in REGION_COLUMNS and c != "year"
+    ]
+    return out[columns].sort_values(["iso3", "year"], ignore_index=True)
+
+
+def dependency_metrics_from_parquet(simple_path, region_path, years=None, **thresholds):
+    """
+    Parquet 에서 필요한 열만 읽어 모든(또는 지정한) 연도의 지표를 계산한다.
+    """
+    simple = read_wpp_parquet(simple_path, SIMPLE_COLUMNS, years=years)
+    region = pq.read_table(region_path, columns=REGION_COLUMNS).to_pandas()
+    return dependency_metrics(simple, region, **thresholds)
+
+
+def main():
+    data_dir = r"C:\Users\parkj\Documents\workspace\my_projects\data\wpp_parquet"
+    df = dependency_metrics_from_parquet(
+        simple_path=f"{data_dir}/simple.parquet",
+        region_path=f"{data_dir}/region.parquet",
+    )
+    print(df)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import os
+import sys
+
+from data import PostgreSQLDB
+
+MAT_SQL = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sql", "wpp_region_dependency_mat.sql")
+
+
+def split_sql_script(script):
+    """
+    Split a mysql-client style script into statements, honouring `DELIMITER` lines.
+    """
+    statements = []
+    delimiter = ";"
+    buffer = []
+    for line in script.splitlines():
+        stripped = line.strip()
+        if stripped.upper().startswith("DELIMITER "):
+            delimiter = stripped.split(None, 1)[1]
+            continue
+        buffer.append(line)
+        if stripped.endswith(delimiter):
+            stmt = "\n".join(buffer).rstrip()[: -len(delimiter)].strip()
+            if stmt and not all(l.strip().startswith("--") or not l.strip() for l in stmt.splitlines()):
+                statements.append(stmt)
+            buffer = []
+    return statements
+
+
+def install_materialized_summary(db, sql_path=MAT_SQL):
+    """
+    Create region_dependency_summary_mat, its change-log triggers and refresh procedures,
+    then fill it once.
+    """
+    with open(sql_path, "r", encoding="utf-8") as f:
+        statements = split_sql_script(f.read())
+    with db.engine.begin() as conn:
+        for stmt in statements:
+            conn.exec_driver_sql(stmt)
+    print(f"✅ Installed: {os.path.basename(sql_path)} ({len(statements)} statements)")
+    refresh_summary(db, full=True)
+
+
+def refresh_summary(db, full=False):
+    """
+    Recompute only the changed iso3/year groups, or everything with `full=True`.
+    """
+    proc = "refresh_region_dependency_summary_full" if full else "refresh_region_dependency_summary"
+    with db.engine.begin() as conn:
+        pending = conn.exec_driver_sql("SELECT COUNT(*) FROM region_dependency_dirty").scalar()
+        conn.exec_driver_sql(f"CALL {proc}()")
+    print(f"🔄 {proc}: {'all' if full else pending} group(s) refreshed")
+
+
+def main():
+    db = PostgreSQLDB(database="wpp")
+    if "--install" in sys.argv:
+        install_materialized_summary(db)
+    else:
+        refresh_summary(db, full="--full" in sys.argv)
+
+
+if __name__ == "__main__":
+    main()
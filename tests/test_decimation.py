@@ -0,0 +1,91 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "graph"))
+
+from gg import Gg, lttb_indices, minmax_indices  # noqa: E402
+
+
+class MinmaxIndicesTest(unittest.TestCase):
+    def test_keeps_first_min_max_last_per_bin(self):
+        rng = np.random.default_rng(0)
+        x = np.sort(rng.uniform(0, 100, 5_000))
+        y = rng.normal(size=x.size)
+        n_bins = 50
+        keep = minmax_indices(x, y, n_bins)
+
+        self.assertTrue((np.diff(keep) > 0).all())
+        bins = np.minimum(((x - x[0]) / (x[-1] - x[0]) * n_bins).astype(int), n_bins - 1)
+        for b in np.unique(bins):
+            members = np.flatnonzero(bins == b)
+            kept = np.intersect1d(keep, members)
+            self.assertIn(members[0], kept)
+            self.assertIn(members[-1], kept)
+            self.assertEqual(y[kept].min(), y[members].min())
+            self.assertEqual(y[kept].max(), y[members].max())
+        self.assertLessEqual(len(keep), 4 * n_bins)
+
+    def test_constant_x_keeps_endpoints(self):
+        np.testing.assert_array_equal(minmax_indices(np.zeros(10), np.arange(10.0), 4), [0, 9])
+
+    def test_runs_split_bins(self):
+        x = np.arange(8.0)
+        y = np.array([0, 5, 1, 2, 9, 3, 4, 0.0])
+        runs = np.array([0, 0, 0, 0, 1, 1, 1, 1])
+        # 한 bin 이지만 run 이 바뀌는 곳에서 나뉘어 양쪽 끝점이 모두 남는다
+        np.testing.assert_array_equal(minmax_indices(x, y, 1, runs), [0, 1, 3, 4, 7])
+
+
+class LttbIndicesTest(unittest.TestCase):
+    def test_output_size_and_endpoints(self):
+        x = np.arange(1_000, dtype=float)
+        y = np.sin(x / 50)
+        keep = lttb_indices(x, y, 100)
+        self.assertEqual(len(keep), 100)
+        self.assertEqual(keep[0], 0)
+        self.assertEqual(keep[-1], 999)
+        self.assertTrue((np.diff(keep) > 0).all())
+
+    def test_keeps_spike(self):
+        x = np.arange(1_000, dtype=float)
+        y = np.zeros(1_000)
+        y[537] = 10.0
+        self.assertIn(537, lttb_indices(x, y, 50))
+
+    def test_small_input_is_returned_whole(self):
+        np.testing.assert_array_equal(lttb_indices(np.arange(5.0), np.arange(5.0), 10), np.arange(5))
+
+
+class ReduceLineTest(unittest.TestCase):
+    def setUp(self):
+        self.x = np.arange(30_000, dtype=float)
+        self.y = np.sin(self.x / 500)
+        self.y[10_000:20_000] = np.nan
+
+    def _assert_gap_kept(self, method):
+        g = Gg()
+        g.point_budget = 1_000
+        g.downsample_method = method
+        x, y = g._reduce_line(self.x, self.y)
+        self.assertLess(len(x), 2_000)
+        self.assertTrue((np.diff(x) > 0).all())
+        gap = np.flatnonzero(np.isnan(y))
+        self.assertEqual(len(gap), 1)
+        self.assertTrue(10_000 <= x[gap[0]] < 20_000)
+        # 결측 구간을 가로지르는 선분이 없다
+        finite = ~np.isnan(y)
+        steps = np.diff(x)[finite[:-1] & finite[1:]]
+        self.assertLess(steps.max(), 10_000)
+
+    def test_minmax_keeps_gap(self):
+        self._assert_gap_kept('minmax')
+
+    def test_lttb_keeps_gap(self):
+        self._assert_gap_kept('lttb')
+
+
+if __name__ == "__main__":
+    unittest.main()
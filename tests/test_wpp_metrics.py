@@ -0,0 +1,62 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "processor"))
+
+from wpp_metrics import _mysql_div, dependency_metrics  # noqa: E402
+
+
+class MysqlDivTest(unittest.TestCase):
+    def test_rounds_half_up_to_four_decimals(self):
+        num = [1, 2, 5, 4, 15, 7]
+        den = [3, 3, 100_000, 100_000, 100_000, 7]
+        np.testing.assert_array_equal(_mysql_div(num, den), [3333, 6667, 1, 0, 2, 10_000])
+
+    def test_zero_denominator_is_nan(self):
+        result = _mysql_div([1, 0], [0, 0])
+        self.assertTrue(np.isnan(result).all())
+
+
+class DependencyMetricsTest(unittest.TestCase):
+    def setUp(self):
+        self.simple = pd.DataFrame(
+            {
+                "iso3": ["AAA"] * 5 + ["BBB"] * 2,
+                "year": ["2023"] * 7,
+                "age": [0, 10, 20, 70, 30, 0, 40],
+                "population": pd.array([100, 200, 300, 400, None, None, None], dtype="Int32"),
+            }
+        )
+        self.region = pd.DataFrame(
+            {
+                "iso3": ["AAA", "BBB"],
+                "region": ["R", "R"],
+                "subregion": ["S", "S"],
+                "country": ["A", "B"],
+            }
+        )
+
+    def test_hand_computed_group(self):
+        row = dependency_metrics(self.simple, self.region).set_index("iso3").loc["AAA"]
+        # 합계 1000, 연령가중합 36000, 유소년 300, 노년 400, 생산연령 300, 0-4세 100
+        self.assertEqual(row["total_population"], 1000)
+        self.assertEqual(row["weighted_avg_age"], 36.0)
+        self.assertAlmostEqual(row["total_dependency_ratio"], 233.33)
+        self.assertAlmostEqual(row["youth_dependency_ratio"], 100.0)
+        self.assertAlmostEqual(row["elderly_dependency_ratio"], 133.33)
+        self.assertEqual(row["five_year_avg_birth_rate"], 20)
+
+    def test_all_null_group_is_kept_with_null_metrics(self):
+        out = dependency_metrics(self.simple, self.region)
+        self.assertEqual(list(out["iso3"]), ["AAA", "BBB"])
+        row = out.set_index("iso3").loc["BBB"]
+        metrics = row.drop(["year", "region", "subregion", "country"])
+        self.assertTrue(metrics.isna().all(), metrics)
+
+
+if __name__ == "__main__":
+    unittest.main()